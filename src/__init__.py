@@ -2,17 +2,37 @@
 RanobeLIB API - модуль для скачивания новелл с сайта RanobeLIB
 """
 
-from .api import RanobeLibAPI
-from .auth import RanobeLibAuth
-from .branches import get_branch_info_for_display, get_formatted_branches_with_teams
-from .creators import EpubCreator, Fb2Creator, HtmlCreator, TxtCreator
-from .img import ImageHandler
-from .parser import RanobeLibParser
-from .processing import ContentProcessor
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api import RanobeLibAPI
+    from .auth import RanobeLibAuth
+    from .branches import get_branch_info_for_display, get_formatted_branches_with_teams
+    from .creators import EpubCreator, Fb2Creator, HtmlCreator, TxtCreator
+    from .img import ImageHandler
+    from .parser import RanobeLibParser
+    from .processing import ContentProcessor
+
+# Настройки импортируются сразу: модуль лёгкий, а имя settings совпадает с именем подмодуля
 from .settings import Settings, settings
 
 __version__ = "0.4"
 
+_LAZY_IMPORTS = {
+    "ContentProcessor": ".processing",
+    "EpubCreator": ".creators",
+    "Fb2Creator": ".creators",
+    "get_branch_info_for_display": ".branches",
+    "get_formatted_branches_with_teams": ".branches",
+    "HtmlCreator": ".creators",
+    "ImageHandler": ".img",
+    "RanobeLibAPI": ".api",
+    "RanobeLibAuth": ".auth",
+    "RanobeLibParser": ".parser",
+    "TxtCreator": ".creators",
+}
+
 __all__ = [
     "ContentProcessor",
     "EpubCreator",
@@ -27,4 +47,19 @@ __all__ = [
     "Settings",
     "settings",
     "TxtCreator",
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Ленивая загрузка публичных объектов пакета при первом обращении (PEP 562)."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Список атрибутов пакета с учётом лениво загружаемых имён."""
+    return sorted(set(globals()) | set(__all__))
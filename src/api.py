@@ -2,31 +2,197 @@
 Модуль для работы с API RanobeLIB
 """
 
+import copy
+import datetime
+import hashlib
+import json
+import os
+import random
+import socket
 import threading
 import time
-from collections import deque
-from typing import Any, Callable, Deque, Dict, List, Optional
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+from .settings import USER_DATA_DIR
 
 DEFAULT_REQUESTS_LIMIT = 90
 REQUESTS_PERIOD = 60
 REQUEST_TIMEOUT = 10
-RETRY_DELAYS = [3, 3, 30, 30, 30]
+MAX_RETRY_ATTEMPTS = 5
+RETRY_BASE_DELAY = 1.5
+RETRY_MAX_DELAY = 60
+MAX_RATE_LIMITED_WAITS = 10
+DEFAULT_RETRY_AFTER = 30
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RECOVERY_SUCCESSES = 3
+CIRCUIT_COOLDOWN = 60
+POOL_SIZE = 16
+API_CACHE_TTL = 300
+API_CACHE_DIR = os.path.join(USER_DATA_DIR, "api_cache")
+API_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+API_CACHE_MAX_FILES = 256
+PARALLEL_REQUESTS = 4
+DNS_CACHE_ENABLED = True
+DNS_CACHE_TTL = 300
+DNS_CACHE_MAX_ENTRIES = 32
+
+_NOVEL_INFO_FIELDS = (
+    "summary",
+    "genres",
+    "tags",
+    "teams",
+    "authors",
+    "status_id",
+    "artists",
+    "format",
+    "publisher",
+)
+_EMPTY: Dict[str, Any] = {}
+_MODERATION_PENDING = 0
+
+_NOVEL_INFO_PARAMS = [("fields[]", field) for field in _NOVEL_INFO_FIELDS]
+
+RequestParams = Union[Dict[str, Any], Sequence[Tuple[str, Any]]]
 
 
 class OperationCancelledError(Exception):
     """Исключение, выбрасываемое при отмене операции."""
 
 
+class RateLimitedError(requests.exceptions.RequestException):
+    """Исключение для ответа 429 с указанным сервером временем ожидания."""
+
+    def __init__(self, retry_after: float, *args, **kwargs):
+        super().__init__(f"Слишком много запросов, повтор через {retry_after:.0f} с", *args, **kwargs)
+        self.retry_after = retry_after
+
+
+def _decode_json(response: requests.Response) -> Any:
+    """Декодирование JSON-ответа (orjson при наличии) с исключениями requests."""
+    try:
+        return _json_loads(response.content)
+    except ValueError as e:
+        raise requests.exceptions.JSONDecodeError(str(e), response.text, 0) from e
+
+
+def _parse_retry_after(value: Optional[str]) -> float:
+    """Разбор заголовка Retry-After (секунды или HTTP-дата)."""
+    if not value:
+        return DEFAULT_RETRY_AFTER
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+    return max(0.0, (retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+
+_dns_cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+_dns_cache_hosts: Set[str] = set()
+_dns_cache_lock = threading.Lock()
+_dns_cache_installed = False
+
+
+def _install_dns_cache(hosts: Sequence[str]) -> None:
+    """Подмена socket.getaddrinfo на уровне процесса: кэшируются только хосты API, размер кэша ограничен."""
+    global _dns_cache_installed
+    with _dns_cache_lock:
+        _dns_cache_hosts.update(host.lower() for host in hosts if host)
+        if _dns_cache_installed:
+            return
+        _dns_cache_installed = True
+
+    original_getaddrinfo = socket.getaddrinfo
+
+    def cached_getaddrinfo(*args, **kwargs):
+        host = args[0] if args else kwargs.get("host")
+        if not isinstance(host, str) or host.lower() not in _dns_cache_hosts:
+            return original_getaddrinfo(*args, **kwargs)
+
+        key = (args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        with _dns_cache_lock:
+            entry = _dns_cache.get(key)
+        if entry and entry[0] > now:
+            return entry[1]
+
+        result = original_getaddrinfo(*args, **kwargs)
+        with _dns_cache_lock:
+            _dns_cache.pop(key, None)
+            if len(_dns_cache) >= DNS_CACHE_MAX_ENTRIES:
+                for stale_key in [k for k, (expires, _) in _dns_cache.items() if expires <= now]:
+                    del _dns_cache[stale_key]
+                while len(_dns_cache) >= DNS_CACHE_MAX_ENTRIES:
+                    del _dns_cache[next(iter(_dns_cache))]
+            _dns_cache[key] = (now + DNS_CACHE_TTL, result)
+        return result
+
+    socket.getaddrinfo = cached_getaddrinfo
+
+
+_api_cache_pruned = threading.Event()
+
+
+def _prune_api_cache() -> None:
+    """Удаление устаревших файлов кэша ответов API и ограничение их количества."""
+    try:
+        entries = [entry for entry in os.scandir(API_CACHE_DIR) if entry.is_file()]
+    except OSError:
+        return
+
+    now = time.time()
+    kept: List[Tuple[float, str]] = []
+    stale: List[str] = []
+    for entry in entries:
+        try:
+            mtime = entry.stat().st_mtime
+        except OSError:
+            continue
+        if now - mtime > API_CACHE_MAX_AGE:
+            stale.append(entry.path)
+        else:
+            kept.append((mtime, entry.path))
+
+    kept.sort(reverse=True)
+    stale.extend(path for _, path in kept[API_CACHE_MAX_FILES:])
+    for path in stale:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
 class RanobeLibAPI:
     """Класс для работы с API RanobeLIB"""
 
+    _consec_fail = 0
+    _consec_ok = 0
+    _retries_enabled = True
+    _retry_cooldown_until = 0.0
+    _circuit_lock = threading.Lock()
+
     def __init__(self):
         self.api_url = "https://api.cdnlibs.org/api/manga/"
         self.site_url = "https://ranobelib.me"
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=0)
+        self.session.mount("https://", adapter)
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
@@ -37,10 +203,21 @@ class RanobeLibAPI:
         )
         self.rate_limit = DEFAULT_REQUESTS_LIMIT
         self.rate_remaining = DEFAULT_REQUESTS_LIMIT
-        self.window_start_time = time.monotonic()
+        self._remaining_at = time.monotonic()
+        self._win_start = time.monotonic()
+        self._cur_count = 0
+        self._prev_count = 0
+        self._rate_lock = threading.Lock()
+        self._mem_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._cache_lock = threading.Lock()
         self.token_refresh_callback: Optional[Callable[[], bool]] = None
+        self._token_refresh_lock = threading.Lock()
+        self._failed_refresh_auth: Optional[str] = None
         self.cancellation_event = threading.Event()
 
+        if DNS_CACHE_ENABLED:
+            _install_dns_cache([urlparse(self.api_url).hostname, urlparse(self.site_url).hostname])
+
     def cancel_pending_requests(self):
         """Установка флага отмены для ожидающих запросов."""
         self.cancellation_event.set()
@@ -63,13 +240,21 @@ class RanobeLibAPI:
     def make_request(
         self,
         url: str,
-        params: Optional[Dict[str, Any]] = None,
+        params: Optional[RequestParams] = None,
         retry: bool = True,
+        cache: bool = False,
     ) -> Dict[str, Any]:
         """Выполнение запроса к API с контролем частоты, обработкой ошибок и повторными попытками."""
         if self.cancellation_event.is_set():
             raise OperationCancelledError("Операция отменена")
-            
+
+        cache_key = self._cache_key(url, params) if cache else None
+        if cache_key:
+            with self._cache_lock:
+                cached = self._mem_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < API_CACHE_TTL:
+                return copy.deepcopy(cached[1])
+
         self.wait_for_rate_limit()
         
         if self.cancellation_event.is_set():
@@ -77,17 +262,22 @@ class RanobeLibAPI:
 
         if not retry:
             try:
-                return self._perform_request(url, params)
+                res = self._perform_request(url, params, cache_key)
             except requests.exceptions.RequestException:
                 return {}
+        else:
+            res = self._retry_request(self._perform_request, url, params, cache_key)
+            if res is None:
+                return {}
 
-        res = self._retry_request(self._perform_request, url, params)
-        return res if res is not None else {}
+        if cache_key and res:
+            with self._cache_lock:
+                self._mem_cache[cache_key] = (time.monotonic(), copy.deepcopy(res))
+        return res
 
     def extract_slug_from_url(self, url: str) -> Optional[str]:
         """Извлечение slug из URL новеллы."""
-        parsed_url = urlparse(url)
-        path_parts = parsed_url.path.strip("/").split("/")
+        path_parts = urlparse(url).path.strip("/").split("/", 3)
 
         if len(path_parts) >= 3 and path_parts[0] == "ru" and path_parts[1] == "book":
             return path_parts[2]
@@ -95,53 +285,37 @@ class RanobeLibAPI:
 
     def get_novel_info(self, slug: str) -> Dict[str, Any]:
         """Получение информации о новелле."""
-        fields = [
-            "summary",
-            "genres",
-            "tags",
-            "teams",
-            "authors",
-            "status_id",
-            "artists",
-            "format",
-            "publisher",
-        ]
-
-        url_params = "&".join([f"fields[]={field}" for field in fields])
-        url = f"{self.api_url}{slug}?{url_params}"
-
-        data = self.make_request(url)
+        url = f"{self.api_url}{slug}"
+
+        data = self.make_request(url, params=_NOVEL_INFO_PARAMS, cache=True)
         return data.get("data", {})
 
     def get_novel_chapters(self, slug: str) -> List[Dict[str, Any]]:
         """Получение списка глав новеллы."""
         url = f"{self.api_url}{slug}/chapters"
-        data = self.make_request(url)
+        data = self.make_request(url, cache=True)
 
-        chapters: List[Dict[str, Any]] = data.get("data", [])
+        chapters: Sequence[Dict[str, Any]] = data.get("data") or ()
 
         filtered_chapters: List[Dict[str, Any]] = []
         for chapter in chapters:
-            branches = chapter.get("branches", [])
-            is_on_moderation = any(
-                isinstance(branch, dict)
-                and branch.get("moderation", {}).get("id") == 0
+            branches = chapter.get("branches") or ()
+            if any(
+                (branch.get("moderation") or _EMPTY).get("id") == _MODERATION_PENDING
                 for branch in branches
-            )
-
-            if is_on_moderation:
+                if isinstance(branch, dict)
+            ):
                 continue
-                
-            valid_branches = []
-            for branch in branches:
-                if isinstance(branch, dict):
-                    restricted = branch.get("restricted_view")
-                    if restricted and restricted.get("is_open") is False:
-                        continue
-                valid_branches.append(branch)
+
+            valid_branches = [
+                branch
+                for branch in branches
+                if not isinstance(branch, dict) or (branch.get("restricted_view") or _EMPTY).get("is_open") is not False
+            ]
 
             if valid_branches:
-                chapter["branches"] = valid_branches
+                if len(valid_branches) != len(branches):
+                    chapter = {**chapter, "branches": valid_branches}
                 filtered_chapters.append(chapter)
 
         return filtered_chapters
@@ -155,9 +329,9 @@ class RanobeLibAPI:
     ) -> Dict[str, Any]:
         """Получение содержимого главы."""
         url = f"{self.api_url}{slug}/chapter"
-        params = {"volume": volume, "number": number}
+        params: Tuple[Tuple[str, Any], ...] = (("volume", volume), ("number", number))
         if branch_id:
-            params["branch_id"] = branch_id
+            params += (("branch_id", branch_id),)
 
         data = self.make_request(url, params=params)
         return data.get("data", {})
@@ -168,56 +342,195 @@ class RanobeLibAPI:
         data = self.make_request(url, retry=False)
         return data.get("data", {})
 
-    def wait_for_rate_limit(self) -> None:
-        """Динамическая задержка на основе реальных заголовков сервера."""
-        if self.rate_remaining <= 2:
-            elapsed = time.monotonic() - self.window_start_time
+    def wait_for_rate_limit(self, upcoming_requests: int = 0) -> None:
+        """Ожидание по скользящему окну из двух счётчиков (текущее и предыдущее окно)."""
+        needed = 1 + upcoming_requests
+        while True:
+            with self._rate_lock:
+                wait_time = self._reserve_rate_slot(needed)
+            if wait_time <= 0:
+                return
+            self._interruptible_sleep(wait_time)
+
+    def _reserve_rate_slot(self, needed: int) -> float:
+        """Резервирование места в окне запросов; возвращает время ожидания, если места нет."""
+        now = time.monotonic()
+        since_remaining = now - self._remaining_at
+        if since_remaining < REQUESTS_PERIOD and self.rate_remaining < needed:
+            return max(REQUESTS_PERIOD - since_remaining, 0.01)
+
+        elapsed = now - self._win_start
+        limit = self.rate_limit
+        if elapsed < REQUESTS_PERIOD and self._prev_count + self._cur_count + needed <= limit:
+            self._cur_count += 1
+            self.rate_remaining -= 1
+            return 0.0
+
+        if elapsed >= REQUESTS_PERIOD:
+            self._prev_count = self._cur_count if elapsed < 2 * REQUESTS_PERIOD else 0
+            self._cur_count = 0
+            self._win_start += REQUESTS_PERIOD * (elapsed // REQUESTS_PERIOD)
+            elapsed = now - self._win_start
+
+        weight = 1 - elapsed / REQUESTS_PERIOD
+        if self._prev_count * weight + self._cur_count + needed <= limit:
+            self._cur_count += 1
+            self.rate_remaining -= 1
+            return 0.0
+
+        free = limit - self._cur_count - needed
+        if free >= 0 and self._prev_count:
+            wait_time = REQUESTS_PERIOD * (1 - free / self._prev_count) - elapsed
+        else:
             wait_time = REQUESTS_PERIOD - elapsed
-            if wait_time > 0:
-                self._interruptible_sleep(wait_time)
-            self.window_start_time = time.monotonic()
-            
-        elif self.rate_remaining <= 10:
-            elapsed = time.monotonic() - self.window_start_time
-            remaining_time = REQUESTS_PERIOD - elapsed
-            if remaining_time > 0:
-                delay = remaining_time / self.rate_remaining
-                self._interruptible_sleep(delay)
+        return max(wait_time, 0.01)
 
-    def _interruptible_sleep(self, duration: float):
+    def _interruptible_sleep(self, duration: float) -> None:
         """Приостанавливает выполнение на заданное время, но может быть прервано событием отмены."""
         if duration <= 0:
             return
-
-        end_time = time.monotonic() + duration
-        while time.monotonic() < end_time:
-            if self.cancellation_event.wait(timeout=0.1):
-                raise OperationCancelledError("Операция отменена")
+        if self.cancellation_event.wait(timeout=duration):
+            raise OperationCancelledError("Операция отменена")
 
     def _retry_request(self, func: Callable, *args, **kwargs) -> Any:
-        """Выполнение функции с повторными попытками."""
-        for i, delay in enumerate(RETRY_DELAYS):
+        """Выполнение функции с повторными попытками (экспоненциальная задержка с джиттером)."""
+        if not self._retries_allowed():
+            try:
+                result = func(*args, **kwargs)
+            except requests.exceptions.RequestException:
+                self._record_failure()
+                raise
+            self._record_success()
+            return result
+
+        attempt = 0
+        rate_limited_waits = 0
+        while True:
             try:
-                return func(*args, **kwargs)
+                result = func(*args, **kwargs)
+                self._record_success()
+                return result
+            except RateLimitedError as e:
+                rate_limited_waits += 1
+                if rate_limited_waits > MAX_RATE_LIMITED_WAITS:
+                    print(f"❌ Сервер продолжает ограничивать запросы: {e}.")
+                    raise
+                if e.retry_after >= 10:
+                    print(f"\n⚠️ Превышен лимит запросов. Следующая попытка через {e.retry_after:.0f} секунд...")
+                self._interruptible_sleep(e.retry_after)
             except requests.exceptions.RequestException as e:
-                is_last_attempt = i == len(RETRY_DELAYS) - 1
-                is_long_delay = delay >= 30
-
-                if is_long_delay:
-                    print(f"\n⚠️ Ошибка соединения: {e}. Следующая попытка через {delay} секунд...")
-
-                if is_last_attempt:
+                attempt += 1
+                self._record_failure()
+                if attempt >= MAX_RETRY_ATTEMPTS or not self._retries_allowed():
                     print(f"❌ Соединение не установлено: {e}. Проверьте подключение к сети или попробуйте позже.")
                     raise
 
+                delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt))
+                if delay >= 10:
+                    print(f"\n⚠️ Ошибка соединения: {e}. Следующая попытка через {delay:.0f} секунд...")
                 self._interruptible_sleep(delay)
 
-        return None
+    @classmethod
+    def _retries_allowed(cls) -> bool:
+        """Проверка, разрешены ли повторные попытки (не сработал ли предохранитель)."""
+        with cls._circuit_lock:
+            if cls._retries_enabled:
+                return True
+            if time.monotonic() >= cls._retry_cooldown_until:
+                cls._retries_enabled = True
+                cls._consec_fail = 0
+                print("🔄 Повторные попытки запросов снова включены.")
+                return True
+            return False
+
+    @classmethod
+    def _record_success(cls) -> None:
+        """Учёт успешного запроса для предохранителя повторных попыток."""
+        with cls._circuit_lock:
+            cls._consec_fail = 0
+            cls._consec_ok += 1
+            if not cls._retries_enabled and cls._consec_ok >= CIRCUIT_RECOVERY_SUCCESSES:
+                cls._retries_enabled = True
+                print("✅ Соединение восстановлено, повторные попытки запросов включены.")
+
+    @classmethod
+    def _record_failure(cls) -> None:
+        """Учёт неудачного запроса; при серии ошибок повторные попытки временно отключаются."""
+        with cls._circuit_lock:
+            cls._consec_ok = 0
+            cls._consec_fail += 1
+            if cls._retries_enabled and cls._consec_fail >= CIRCUIT_FAILURE_THRESHOLD:
+                cls._retries_enabled = False
+                cls._retry_cooldown_until = time.monotonic() + CIRCUIT_COOLDOWN
+                print(f"\n⚠️ Слишком много ошибок подряд. Повторные попытки отключены на {CIRCUIT_COOLDOWN} секунд.")
+
+    def _cache_key(self, url: str, params: Optional[RequestParams]) -> str:
+        """Формирование ключа кэша по URL, параметрам и текущему токену."""
+        params_part = json.dumps(params, sort_keys=True, ensure_ascii=False) if params else ""
+        auth_part = self.session.headers.get("Authorization", "")
+        return hashlib.sha1(f"{url}\n{params_part}\n{auth_part}".encode("utf-8")).hexdigest()
+
+    def _load_disk_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Загрузка сохранённого ответа с валидаторами ETag / Last-Modified."""
+        try:
+            with open(os.path.join(API_CACHE_DIR, f"{cache_key}.json"), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry if isinstance(entry, dict) and "data" in entry else None
+
+    def _save_disk_cache(self, cache_key: str, response: requests.Response, data: Dict[str, Any]) -> None:
+        """Сохранение ответа на диск, если сервер вернул валидаторы для условного запроса."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
 
-    def _perform_request(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        entry = {"etag": etag, "last_modified": last_modified, "data": data}
+        path = os.path.join(API_CACHE_DIR, f"{cache_key}.json")
+        try:
+            if not _api_cache_pruned.is_set():
+                _api_cache_pruned.set()
+                _prune_api_cache()
+            os.makedirs(API_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️ Не удалось сохранить кэш ответа API: {e}")
+
+    def _refresh_token_after_401(self, sent_auth: Optional[str]) -> bool:
+        """Обновление токена после 401; параллельные потоки обновляют его только один раз."""
+        with self._token_refresh_lock:
+            if self.session.headers.get("Authorization") != sent_auth:
+                return True
+            if self._failed_refresh_auth == sent_auth:
+                return False
+            print("\n🔑 Токен недействителен. Попытка обновления...")
+            if self.token_refresh_callback():
+                return True
+            self._failed_refresh_auth = sent_auth
+            return False
+
+    def _perform_request(
+        self,
+        url: str,
+        params: Optional[RequestParams] = None,
+        cache_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """Непосредственное выполнение запроса и обработка ответа."""
+        disk_entry = self._load_disk_cache(cache_key) if cache_key else None
+        headers: Dict[str, str] = {}
+        if disk_entry:
+            if disk_entry.get("etag"):
+                headers["If-None-Match"] = disk_entry["etag"]
+            if disk_entry.get("last_modified"):
+                headers["If-Modified-Since"] = disk_entry["last_modified"]
+
         try:
-            response = self.session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+            sent_auth = self.session.headers.get("Authorization")
+            response = self.session.get(url, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
 
             limit_header = response.headers.get("X-RateLimit-Limit")
             if limit_header and limit_header.isdigit():
@@ -225,27 +538,42 @@ class RanobeLibAPI:
 
             remaining_header = response.headers.get("X-RateLimit-Remaining")
             if remaining_header and remaining_header.isdigit():
-                new_remaining = int(remaining_header)
-                if new_remaining > self.rate_remaining:
-                    self.window_start_time = time.monotonic()
-                self.rate_remaining = new_remaining
+                with self._rate_lock:
+                    self.rate_remaining = int(remaining_header)
+                    self._remaining_at = time.monotonic()
 
             if response.status_code == 401 and self.token_refresh_callback:
-                print("\n🔑 Токен недействителен. Попытка обновления...")
-                if self.token_refresh_callback():
+                if self._refresh_token_after_401(sent_auth):
                     print("✅ Токен обновлен. Повторяем запрос...")
-                    response = self.session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+                    response = self.session.get(url, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
                 else:
                     print("⚠️ Не удалось обновить токен.")
 
+            if response.status_code == 429:
+                raise RateLimitedError(_parse_retry_after(response.headers.get("Retry-After")), response=response)
+
             if response.status_code == 404:
                 try:
-                    return response.json()
+                    return _decode_json(response)
                 except requests.exceptions.JSONDecodeError:
                     return {}
 
+            if response.status_code == 304:
+                if disk_entry:
+                    try:
+                        os.utime(os.path.join(API_CACHE_DIR, f"{cache_key}.json"))
+                    except OSError:
+                        pass
+                    return disk_entry["data"]
+                response = self.session.get(
+                    url, params=params, headers={"Cache-Control": "no-cache"}, timeout=REQUEST_TIMEOUT
+                )
+
             response.raise_for_status()
-            return response.json()
+            data = _decode_json(response)
+            if cache_key:
+                self._save_disk_cache(cache_key, response, data)
+            return data
         except requests.exceptions.JSONDecodeError:
             print(f"⚠️ Ошибка декодирования JSON ответа для URL: {url}")
             raise 
\ No newline at end of file
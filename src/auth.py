@@ -7,10 +7,9 @@ import hashlib
 import json
 import os
 import secrets
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 from urllib.parse import parse_qs, urlparse
 
-from cryptography.fernet import Fernet
 import keyring
 import keyring.errors
 import requests
@@ -18,6 +17,12 @@ import requests
 from .api import RanobeLibAPI
 from .settings import USER_DATA_DIR
 
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+
+_sha256 = hashlib.sha256
+_b64 = base64.urlsafe_b64encode
+
 
 class RanobeLibAuth:
     """Класс для работы с аутентификацией в API RanobeLIB"""
@@ -257,10 +262,8 @@ class RanobeLibAuth:
             "client_id": 1,
             "refresh_token": refresh_token_str,
         }
-        headers = dict(self.api.session.headers)
-
         try:
-            response = self.api.session.post(token_url, json=payload, headers=headers, timeout=10)
+            response = self.api.session.post(token_url, json=payload, timeout=10)
 
             if response.status_code == 400:
                 print("⚠️ Refresh-токен недействителен. Требуется повторная авторизация.")
@@ -290,14 +293,14 @@ class RanobeLibAuth:
         return None
 
     def _generate_random_string(self, length: int) -> str:
-        """Генерация случайной строки из буквенно-цифрового алфавита."""
-        alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
-        return "".join(secrets.choice(alphabet) for _ in range(length))
+        """Генерация случайной строки из URL-безопасного алфавита (подходит для PKCE)."""
+        return secrets.token_urlsafe((length * 3 + 3) // 4)[:length]
 
-    def _code_challenge(self, verifier: str) -> str:
+    def _code_challenge(self, verifier: Union[str, bytes]) -> str:
         """Вычисление code_challenge в соответствии с PKCE (SHA256 + Base64url, без =)"""
-        digest = hashlib.sha256(verifier.encode("utf-8")).digest()
-        return base64.urlsafe_b64encode(digest).decode("utf-8").rstrip("=")
+        if isinstance(verifier, str):
+            verifier = verifier.encode("ascii")
+        return _b64(_sha256(verifier).digest()).rstrip(b"=").decode("ascii")
 
     def _exchange_code_for_token(
         self, code: str, secret: str, redirect_uri: str
@@ -311,18 +314,18 @@ class RanobeLibAuth:
             "code_verifier": secret,
             "code": code,
         }
-        headers = dict(self.api.session.headers)
-
         try:
-            response = self.api.session.post(token_url, json=payload, headers=headers, timeout=10)
+            response = self.api.session.post(token_url, json=payload, timeout=10)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
             print(f"⚠️ Не удалось получить токен: {e}")
             return None
 
-    def _get_fernet(self) -> Fernet:
+    def _get_fernet(self) -> "Fernet":
         """Получение объекта Fernet со случайным секретом для устройства."""
+        from cryptography.fernet import Fernet
+
         if self._ephemeral_fernet_key:
             return Fernet(self._ephemeral_fernet_key)
 
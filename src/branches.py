@@ -3,7 +3,10 @@
 """
 import re
 from collections import defaultdict
-from typing import Any, Dict, List, Set
+from functools import lru_cache
+from typing import Any, Dict, List, Set, Tuple
+
+_NUM_SPLIT = re.compile(r"[.\-_]")
 
 
 def get_formatted_branches_with_teams(
@@ -11,8 +14,7 @@ def get_formatted_branches_with_teams(
 ) -> Dict[str, Dict[str, Any]]:
     """Формирование агрегированных данных по веткам переводов, командам и числу глав."""
     base_branches = _get_base_branches_from_novel_info(novel_info)
-    chapter_counts = _get_chapter_counts_by_branch(chapters_data)
-    teams_by_branch = _get_teams_by_branch(chapters_data)
+    chapter_counts, teams_by_branch = _collect_branch_stats(chapters_data)
 
     formatted_branches = {}
     all_branch_ids = set(base_branches.keys()) | set(chapter_counts.keys())
@@ -21,14 +23,15 @@ def get_formatted_branches_with_teams(
         if chapter_counts.get(branch_id, 0) == 0:
             continue
 
-        branch_info = base_branches.get(branch_id, {"id": branch_id, "teams": [], "active_teams": []})
+        branch_info = base_branches.get(branch_id) or _empty_branch(branch_id)
         all_team_names = teams_by_branch.get(branch_id, set())
 
         formatted_branches[branch_id] = {
             "id": branch_id,
             "name": _format_branch_name(branch_id, branch_info),
             "chapter_count": chapter_counts.get(branch_id, 0),
-            "team_names": sorted(list(all_team_names)),
+            "team_names": sorted(all_team_names),
+            "team_names_set": all_team_names,
         }
 
     return formatted_branches
@@ -44,7 +47,10 @@ def get_branch_info_for_display(branch_info: Dict[str, Any]) -> str:
 
     if team_names:
         name_parts = {part.strip() for part in branch_name.split(",")}
-        if set(team_names) - name_parts:
+        team_names_set = branch_info.get("team_names_set")
+        if team_names_set is None:
+            team_names_set = set(team_names)
+        if team_names_set - name_parts:
             result += f" [{', '.join(team_names)}]"
 
     result += f" ({chapter_count} глав)"
@@ -60,60 +66,50 @@ def get_default_branch_chapters(
     chapters_data: List[Dict[str, Any]],
 ) -> List[Dict[str, Any]]:
     """Выбирает набор глав по умолчанию, по одному переводу на главу."""
-    sorted_chapters_list = sorted(chapters_data, key=lambda x: x.get("index", 0))
-    sorted_chapters_list.sort(key=lambda x: parse_chapter_number(x.get("number", "0")))
+    sorted_chapters_list = sorted(
+        chapters_data, key=lambda x: (parse_chapter_number(x.get("number", "0")), x.get("index", 0))
+    )
 
     chapter_branch_map = defaultdict(dict)
     unique_chapter_keys = []
     seen_keys = set()
+    unique_append = unique_chapter_keys.append
+    seen_add = seen_keys.add
 
     for chapter in sorted_chapters_list:
         key = (str(chapter.get("volume", "0")), str(chapter.get("number", "0")))
         if key not in seen_keys:
-            unique_chapter_keys.append(key)
-            seen_keys.add(key)
+            unique_append(key)
+            seen_add(key)
 
         for branch in chapter.get("branches", []):
-            branch_id_str = "0"
-            if isinstance(branch, dict):
-                branch_id_val = branch.get("branch_id")
-                branch_id_str = str(branch_id_val if branch_id_val is not None else "0")
-            elif branch is not None:
-                branch_id_str = str(branch)
-
+            branch_id_str = _norm_bid(branch)
             if branch_id_str not in chapter_branch_map[key]:
                 chapter_branch_map[key][branch_id_str] = {
                     "chapter": chapter,
                     "branch": branch,
                 }
 
-    selected_chapter_keys = set()
     final_list = []
-
-    while len(selected_chapter_keys) < len(unique_chapter_keys):
-        first_unselected_key = None
-        prioritized_branch_id = None
-
-        for key in unique_chapter_keys:
-            if key not in selected_chapter_keys:
-                available_branches = chapter_branch_map.get(key, {})
-                if available_branches:
-                    first_unselected_key = key
-                    prioritized_branch_id = next(iter(available_branches))
-                    break
-
-        if not first_unselected_key or not prioritized_branch_id:
-            break
-
-        for key in unique_chapter_keys:
-            if key not in selected_chapter_keys:
-                available_branches = chapter_branch_map.get(key, {})
-                if prioritized_branch_id in available_branches:
-                    final_list.append(available_branches[prioritized_branch_id])
-                    selected_chapter_keys.add(key)
-
-    final_list.sort(key=lambda x: x["chapter"].get("index", 0))
-    final_list.sort(key=lambda x: parse_chapter_number(x["chapter"].get("number", "0")))
+    final_append = final_list.append
+    remaining = [key for key in unique_chapter_keys if chapter_branch_map.get(key)]
+
+    while remaining:
+        prioritized_branch_id = next(iter(chapter_branch_map[remaining[0]]))
+
+        kept = 0
+        for key in remaining:
+            available_branches = chapter_branch_map[key]
+            if prioritized_branch_id in available_branches:
+                final_append(available_branches[prioritized_branch_id])
+            else:
+                remaining[kept] = key
+                kept += 1
+        del remaining[kept:]
+
+    final_list.sort(
+        key=lambda x: (parse_chapter_number(x["chapter"].get("number", "0")), x["chapter"].get("index", 0))
+    )
 
     return final_list
 
@@ -123,11 +119,10 @@ def _get_base_branches_from_novel_info(novel_info: Dict[str, Any]) -> Dict[str,
     branches = {}
     for team in novel_info.get("teams", []):
         details = team.get("details", {}) or {}
-        branch_id_raw = details.get("branch_id")
-        branch_id = str(branch_id_raw if branch_id_raw is not None else "0")
+        branch_id = _norm_bid(details.get("branch_id"))
 
         if branch_id not in branches:
-            branches[branch_id] = {"id": branch_id, "teams": [], "active_teams": []}
+            branches[branch_id] = _empty_branch(branch_id)
 
         team_info = {
             "id": team.get("id", 0),
@@ -139,46 +134,50 @@ def _get_base_branches_from_novel_info(novel_info: Dict[str, Any]) -> Dict[str,
             branches[branch_id]["active_teams"].append(team_info)
 
     if "0" not in branches:
-        branches["0"] = {"id": "0", "teams": [], "active_teams": []}
+        branches["0"] = _empty_branch("0")
     return branches
 
 
-def _get_chapter_counts_by_branch(chapters_data: List[Dict[str, Any]]) -> Dict[str, int]:
-    """Подсчет количества глав для каждой ветки."""
-    counts = defaultdict(int)
-    for chapter in chapters_data:
-        for branch in chapter.get("branches", []):
-            branch_id = "0"
-            if isinstance(branch, dict):
-                branch_id_raw = branch.get("branch_id")
-                branch_id = str(branch_id_raw if branch_id_raw is not None else "0")
-            elif branch is not None:
-                branch_id = str(branch)
-            counts[branch_id] += 1
-    return counts
+def _empty_branch(branch_id: str) -> Dict[str, Any]:
+    """Пустая запись ветки без команд."""
+    return {"id": branch_id, "teams": [], "active_teams": []}
+
+
+def _norm_bid(branch: Any) -> str:
+    """Приведение ветки (словаря или сырого идентификатора) к строковому id."""
+    if branch is None:
+        return "0"
+    if isinstance(branch, dict):
+        branch_id = branch.get("branch_id")
+        return "0" if branch_id is None else str(branch_id)
+    return str(branch)
 
 
-def _get_teams_by_branch(chapters_data: List[Dict[str, Any]]) -> Dict[str, Set[str]]:
-    """Извлечение команд переводчиков из данных о главах и сопоставление их с ветками."""
-    teams = defaultdict(set)
+def _collect_branch_stats(chapters_data: List[Dict[str, Any]]) -> Tuple[Dict[str, int], Dict[str, Set[str]]]:
+    """Подсчет глав и сбор команд переводчиков по веткам за один проход."""
+    counts: Dict[str, int] = defaultdict(int)
+    teams: Dict[str, Set[str]] = defaultdict(set)
+    teams_get = teams.__getitem__
+
     for chapter in chapters_data:
-        for branch in chapter.get("branches", []):
+        for branch in chapter.get("branches") or ():
+            branch_id = _norm_bid(branch)
+            counts[branch_id] += 1
+
             if not isinstance(branch, dict):
                 continue
 
-            branch_id_raw = branch.get("branch_id")
-            branch_id = str(branch_id_raw if branch_id_raw is not None else "0")
-            teams_list = branch.get("teams", []) or []
+            branch_teams = teams_get(branch_id)
+            teams_list = branch.get("teams")
             if teams_list:
+                add_team = branch_teams.add
                 for team in teams_list:
-                    teams[branch_id].add(team.get("name", "Неизвестный"))
-            elif not teams_list:
+                    add_team(team.get("name", "Неизвестный"))
+            else:
                 team_info = branch.get("team")
-                if team_info and isinstance(team_info, dict) and team_info.get("name"):
-                    teams[branch_id].add(team_info.get("name"))
-                else:
-                    teams[branch_id].add("Неизвестный")
-    return teams
+                team_name = team_info.get("name") if isinstance(team_info, dict) else None
+                branch_teams.add(team_name or "Неизвестный")
+    return counts, teams
 
 
 def _format_branch_name(branch_id: str, branch_info: Dict[str, Any]) -> str:
@@ -193,13 +192,12 @@ def _format_branch_name(branch_id: str, branch_info: Dict[str, Any]) -> str:
     return "Неизвестный"
 
 
+def volume_sort_key(volume: str) -> int:
+    """Ключ сортировки номера тома: число для цифровых значений, иначе 0."""
+    return int(volume) if volume.isdigit() else 0
+
+
+@lru_cache(maxsize=4096)
 def parse_chapter_number(number_str: str) -> tuple:
     """Преобразование строки номера главы в кортеж чисел для сортировки."""
-    parts = re.split(r"[.\-_]", str(number_str))
-    result = []
-    for part in parts:
-        try:
-            result.append(int(part))
-        except ValueError:
-            result.append(part)
-    return tuple(result) 
\ No newline at end of file
+    return tuple(int(part) if part.isdecimal() else part for part in _NUM_SPLIT.split(str(number_str)))
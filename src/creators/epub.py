@@ -5,13 +5,17 @@
 import html as html_lib
 import os
 import re
+from collections import defaultdict
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from bs4 import BeautifulSoup
 from ebooklib import epub
 
+from ..branches import volume_sort_key
 from ..settings import settings
 
+_IMG_SRC_RE = re.compile(r"src=['\"]images/([^'\"]+)['\"]")
+
 
 class EpubCreator:
     def __init__(self, processor):
@@ -120,7 +124,7 @@ class EpubCreator:
         toc: List[Any] = []
         spine: List[Any] = []
         referenced_images: Set[str] = set()
-        volume_chapters: Dict[str, List[Any]] = {}
+        volume_chapters: Dict[str, List[Any]] = defaultdict(list)
 
         prepared_chapters = self.processor.chapter_loader.prepare_chapters(
             novel_info, chapters_data, selected_branch_id, image_folder
@@ -128,14 +132,12 @@ class EpubCreator:
 
         total_volumes = self.processor.metadata_extractor.get_total_volume_count(novel_info)
 
+        self.processor.annotate_chapter_titles(prepared_chapters, total_volumes)
+
         print("📦 Создание EPUB...")
         for i, prep in enumerate(prepared_chapters):
             vol_num = str(prep["volume"])
-            ch_name_decoded = self.parser.decode_html_entities(prep.get("name", "").strip())
-            chapter_title_raw = self.processor.chapter_formatter.format_chapter_title(
-                ch_name_decoded, prep["number"], vol_num, total_volumes
-            )
-            chapter_title = html_lib.escape(chapter_title_raw)
+            chapter_title = html_lib.escape(prep["display_title"])
 
             chapter = epub.EpubHtml(
                 title=chapter_title, file_name=f"chapter_{i+1}.xhtml", lang="ru"
@@ -143,18 +145,17 @@ class EpubCreator:
             chapter.content = f"<h1>{html_lib.escape(chapter_title)}</h1>{prep['html']}"
 
             book.add_item(chapter)
-            volume_chapters.setdefault(vol_num, []).append(chapter)
+            volume_chapters[vol_num].append(chapter)
             spine.append(chapter)
 
-            for img_filename in re.findall(r"src=['\"]images/([^'\"]+)['\"]", prep["html"]):
-                referenced_images.add(img_filename)
+            referenced_images.update(_IMG_SRC_RE.findall(prep["html"]))
 
         if settings.get("group_by_volumes") and total_volumes > 1 and volume_chapters:
-            for vol_num in sorted(volume_chapters.keys(), key=lambda x: int(x) if x.isdigit() else 0):
+            for vol_num in sorted(volume_chapters, key=volume_sort_key):
                 toc.append((epub.Section(f"Том {vol_num}"), tuple(volume_chapters[vol_num])))
         elif volume_chapters:
             all_chapters = []
-            for vol_num in sorted(volume_chapters.keys(), key=lambda x: int(x) if x.isdigit() else 0):
+            for vol_num in sorted(volume_chapters, key=volume_sort_key):
                 all_chapters.extend(volume_chapters[vol_num])
             toc.extend(all_chapters)
 
@@ -165,21 +166,34 @@ class EpubCreator:
         if not os.path.exists(image_folder):
             return
 
-        for filename in referenced_images:
+        added = {item.file_name for item in book.get_items()}
+        for filename in sorted(referenced_images):
             if filename.startswith("cover."):
                 continue
 
-            if filename.lower().endswith((".png", ".jpg", ".jpeg", ".gif")):
-                image_path = os.path.join(image_folder, filename)
-                if not os.path.exists(image_path):
-                    print(f"⚠️ Изображение {filename} не найдено, пропуск.")
-                    continue
-                with open(image_path, "rb") as img_file:
-                    ext = os.path.splitext(filename)[1][1:].replace("jpg", "jpeg")
-                    image_item = epub.EpubItem(
-                        uid=f"image_{filename}",
-                        file_name=f"images/{filename}",
-                        media_type=f"image/{ext}",
-                        content=img_file.read(),
-                    )
-                    book.add_item(image_item) 
\ No newline at end of file
+            if not filename.lower().endswith((".png", ".jpg", ".jpeg", ".gif")):
+                continue
+
+            file_name = f"images/{filename}"
+            if file_name in added:
+                continue
+
+            image_path = os.path.join(image_folder, filename)
+            try:
+                size = os.stat(image_path).st_size
+            except OSError:
+                print(f"⚠️ Изображение {filename} не найдено, пропуск.")
+                continue
+
+            with open(image_path, "rb") as img_file:
+                content = img_file.read(size)
+
+            ext = os.path.splitext(filename)[1][1:].replace("jpg", "jpeg")
+            image_item = epub.EpubItem(
+                uid=f"image_{filename}",
+                file_name=file_name,
+                media_type=f"image/{ext}",
+                content=content,
+            )
+            book.add_item(image_item)
+            added.add(file_name)
@@ -4,16 +4,45 @@
 
 import base64
 import datetime
-import mimetypes
 import os
 import re
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
 import xml.sax.saxutils as saxutils
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Deque, Dict, List, Optional, Set, TextIO, Tuple
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, NavigableString
+from bs4.element import PreformattedString
 
+from ..branches import volume_sort_key
 from ..settings import settings
 
+_B64_CHUNK_SIZE = 57 * 1024
+_IMAGE_READ_WORKERS = 4
+_IMAGE_READ_AHEAD = 8
+_MIME = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+}
+
+
+_XML_ESC = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+
+def _xe(text: str) -> str:
+    """Экранирование спецсимволов XML за один проход."""
+    return text.translate(_XML_ESC)
+
+
+def _read_file(path: str) -> bytes:
+    """Чтение файла целиком (выполняется в фоновом потоке)."""
+    with open(path, "rb") as f:
+        return f.read()
+
 
 class Fb2Creator:
     def __init__(self, processor):
@@ -46,20 +75,26 @@ class Fb2Creator:
 
         description_xml = self._build_description_xml(novel_info, cover_filename)
         body_xml, referenced_images = self._build_body_xml(prepared_chapters, novel_info)
-        binaries_xml = self._build_binaries_xml(image_folder, referenced_images, cover_filename)
-
-        fb2_full = (
-            '<?xml version="1.0" encoding="utf-8"?>\n'
-            f'<FictionBook xmlns="{self._FB2_NAMESPACE}" xmlns:l="{self._XLINK_NAMESPACE}">\n'
-            f"{description_xml}\n{body_xml}\n{binaries_xml}\n"
-            "</FictionBook>"
-        )
 
         title = self.processor.metadata_extractor.extract_title_author_summary(novel_info)[0]
         fb2_filename = self.processor.file_manager.get_safe_filename(title, "fb2")
 
-        with open(fb2_filename, "w", encoding="utf-8") as f:
-            f.write(fb2_full)
+        try:
+            with open(fb2_filename, "w", encoding="utf-8") as f:
+                f.write(
+                    '<?xml version="1.0" encoding="utf-8"?>\n'
+                    f'<FictionBook xmlns="{self._FB2_NAMESPACE}" xmlns:l="{self._XLINK_NAMESPACE}">\n'
+                )
+                f.write(description_xml)
+                f.write("\n")
+                f.write(body_xml)
+                f.write("\n")
+                self._write_binaries(f, image_folder, referenced_images, cover_filename)
+                f.write("\n</FictionBook>")
+        except BaseException:
+            if os.path.exists(fb2_filename):
+                os.remove(fb2_filename)
+            raise
 
         return fb2_filename
 
@@ -70,55 +105,54 @@ class Fb2Creator:
         html = re.sub(r"(?i)<p>\s*</p>", "", html)
 
         soup = BeautifulSoup(html, "lxml")
+        root = soup.body or soup
         referenced_images: Set[str] = set()
 
-        for img in soup.find_all("img"):
-            if isinstance(img, Tag) and img.has_attr("src"):
-                src = os.path.basename(str(img["src"]))
-                referenced_images.add(src)
-                new_tag = soup.new_tag("image", attrs={"l:href": f"#{src}"})
-                img.replace_with(new_tag)
-
-        for i_tag in soup.find_all(["i", "em"]):
-            if isinstance(i_tag, Tag):
-                i_tag.name = "emphasis"
-        for b_tag in soup.find_all(["b", "strong"]):
-            if isinstance(b_tag, Tag):
-                b_tag.name = "strong"
+        for element in root.find_all(["img", "i", "em", "b", "strong"]):
+            name = element.name
+            if name == "img":
+                if element.has_attr("src"):
+                    src = os.path.basename(str(element["src"]))
+                    referenced_images.add(src)
+                    element.replace_with(soup.new_tag("image", attrs={"l:href": f"#{src}"}))
+            elif name == "b":
+                element.name = "strong"
+            elif name != "strong":
+                element.name = "emphasis"
 
         output_parts: List[str] = []
-        for element in soup.contents:
-            text = str(element).strip()
-            if not text:
+        for element in root.contents:
+            if isinstance(element, NavigableString):
+                if isinstance(element, PreformattedString):
+                    continue
+                text = element.strip()
+                if text:
+                    output_parts.append(f"<p>{_xe(text)}</p>")
                 continue
 
-            if isinstance(element, Tag) and element.name == "image":
-                output_parts.append(str(element))
-            elif isinstance(element, Tag) and element.name == "empty-line":
+            name = element.name
+            if name == "empty-line":
                 output_parts.append("<empty-line/>")
-            elif text.lower().startswith("<p"):
-                output_parts.append(text)
+            elif name == "image" or name == "p":
+                output_parts.append(str(element))
             else:
-                output_parts.append(f"<p>{text}</p>")
+                output_parts.append(f"<p>{element}</p>")
 
         return "\n".join(output_parts), referenced_images
 
-    def _encode_image(self, path: str) -> Tuple[str, str]:
-        """Возвращает MIME-тип и base64-содержимое файла."""
-        mime = mimetypes.guess_type(path)[0] or "image/jpeg"
-        with open(path, "rb") as f:
-            encoded = base64.b64encode(f.read()).decode("ascii")
-        return mime, encoded
+    def _image_mime(self, path: str) -> str:
+        """Возвращает MIME-тип изображения по имени файла."""
+        return _MIME.get(os.path.splitext(path)[1].lower(), "image/jpeg")
 
     def _build_description_xml(self, novel_info: Dict[str, Any], cover_filename: Optional[str]) -> str:
         """Создание XML-блока <description> для FB2."""
         title, author, annotation, genres = self.processor.metadata_extractor.extract_title_author_summary(novel_info)
         year = self.processor.metadata_extractor.extract_year(novel_info) or str(datetime.datetime.now().year)
 
-        genres_xml = "\n    ".join(f"<genre>{saxutils.escape(g)}</genre>" for g in genres)
-        author_xml = f"<author>\n      <nickname>{saxutils.escape(author)}</nickname>\n    </author>" if author else ""
+        genres_xml = "\n    ".join(f"<genre>{_xe(g)}</genre>" for g in genres)
+        author_xml = f"<author>\n      <nickname>{_xe(author)}</nickname>\n    </author>" if author else ""
         cover_xml = (
-            f'<coverpage>\n      <image l:href="#{cover_filename}"/>\n    </coverpage>'
+            f'<coverpage>\n      <image l:href="#{_xe(cover_filename)}"/>\n    </coverpage>'
             if cover_filename
             else ""
         )
@@ -126,7 +160,7 @@ class Fb2Creator:
         if annotation:
             plain_annotation = BeautifulSoup(annotation, "lxml").get_text(separator="\n")
             annotation_lines = [
-                f"      <p>{saxutils.escape(line.strip())}</p>" for line in plain_annotation.split("\n") if line.strip()
+                f"      <p>{_xe(line.strip())}</p>" for line in plain_annotation.split("\n") if line.strip()
             ]
             annotation_body = "\n".join(annotation_lines)
             annotation_xml = f"<annotation>\n{annotation_body}\n    </annotation>"
@@ -138,7 +172,7 @@ class Fb2Creator:
   <title-info>
     {genres_xml}
     {author_xml}
-    <book-title>{saxutils.escape(title)}</book-title>
+    <book-title>{_xe(title)}</book-title>
     {annotation_xml}
     {cover_xml}
     <date value="{year}">{year}</date>
@@ -157,60 +191,86 @@ class Fb2Creator:
         novel_info: Dict[str, Any],
     ) -> Tuple[str, Set[str]]:
         """Создание XML-блока <body> и возвращение множества всех использованных изображений."""
-        volume_chapters: Dict[str, List[str]] = {}
+        volume_parts: Dict[str, List[str]] = defaultdict(list)
         all_referenced_images: Set[str] = set()
 
         total_volumes = self.processor.metadata_extractor.get_total_volume_count(novel_info)
 
+        self.processor.annotate_chapter_titles(prepared_chapters, total_volumes)
+        html_to_fb2 = self._html_to_fb2
+
         print("📦 Создание FB2...")
         for i, prep in enumerate(prepared_chapters, 1):
-            ch_name_decoded = self.parser.decode_html_entities(prep.get("name", "").strip())
             vol_num = str(prep["volume"])
-
-            chapter_title = self.processor.chapter_formatter.format_chapter_title(
-                ch_name_decoded, prep["number"], vol_num, total_volumes
-            )
-            fb2_fragment, images = self._html_to_fb2(prep["html"])
+            chapter_title = prep["display_title"]
+            fb2_fragment, images = html_to_fb2(prep["html"])
             all_referenced_images.update(images)
-            section_xml = f"""\
-<section id="ch{i}"><title><p>{saxutils.escape(chapter_title)}</p></title>
-{fb2_fragment}
-</section>"""
-            volume_chapters.setdefault(vol_num, []).append(section_xml)
-
-        body_parts = []
-        if settings.get("group_by_volumes") and total_volumes > 1 and volume_chapters:
-            for vol_num in sorted(volume_chapters.keys(), key=lambda x: int(x) if x.isdigit() else 0):
-                chapters_xml = "\n".join(volume_chapters[vol_num])
-                body_parts.append(
-                    f'<section id="vol{vol_num}"><title><p>Том {vol_num}</p></title>{chapters_xml}</section>'
+            volume_parts[vol_num].extend(
+                (
+                    f'<section id="ch{i}"><title><p>{_xe(chapter_title)}</p></title>\n',
+                    fb2_fragment,
+                    "\n</section>",
                 )
-        elif volume_chapters:
-            for vol_num in sorted(volume_chapters.keys(), key=lambda x: int(x) if x.isdigit() else 0):
-                body_parts.extend(volume_chapters[vol_num])
+            )
 
-        return f"<body>\n{''.join(body_parts)}\n</body>", all_referenced_images
+        parts: List[str] = ["<body>\n"]
+        group_by_volumes = settings.get("group_by_volumes") and total_volumes > 1
+        for vol_num in sorted(volume_parts, key=volume_sort_key):
+            if group_by_volumes:
+                parts.append(f'<section id="vol{vol_num}"><title><p>Том {vol_num}</p></title>')
+                parts.extend(volume_parts[vol_num])
+                parts.append("</section>")
+            else:
+                parts.extend(volume_parts[vol_num])
+        parts.append("\n</body>")
 
-    def _build_binaries_xml(
-        self, image_folder: str, referenced_images: Set[str], cover_filename: Optional[str]
-    ) -> str:
-        """Создание XML-блока с бинарными данными изображений."""
+        return "".join(parts), all_referenced_images
+
+    def _write_binaries(
+        self, f: TextIO, image_folder: str, referenced_images: Set[str], cover_filename: Optional[str]
+    ) -> None:
+        """Потоковая запись изображений в FB2: чтение файлов в фоне, кодирование частями."""
         if not os.path.exists(image_folder):
-            return ""
+            return
 
-        binaries_parts = []
         if cover_filename:
             referenced_images.add(cover_filename)
 
+        images: List[Tuple[str, str]] = []
         for filename in referenced_images:
             image_path = os.path.join(image_folder, filename)
             if not os.path.exists(image_path):
                 print(f"⚠️ Изображение {filename} не найдено, пропуск.")
                 continue
-            try:
-                mime, data_b64 = self._encode_image(image_path)
-                binaries_parts.append(f'<binary id={saxutils.quoteattr(filename)} content-type="{mime}">{data_b64}</binary>')
-            except Exception as e:
-                print(f"⚠️ Не удалось добавить изображение {filename} в FB2: {e}")
-
-        return "\n".join(binaries_parts) 
\ No newline at end of file
+            images.append((filename, image_path))
+
+        if not images:
+            return
+
+        first = True
+        with ThreadPoolExecutor(max_workers=_IMAGE_READ_WORKERS) as executor:
+            pending: Deque[Tuple[str, str, "Future[bytes]"]] = deque()
+            images_iter = iter(images)
+            for filename, image_path in islice(images_iter, _IMAGE_READ_AHEAD):
+                pending.append((filename, image_path, executor.submit(_read_file, image_path)))
+
+            while pending:
+                filename, image_path, future = pending.popleft()
+                next_image = next(images_iter, None)
+                if next_image:
+                    pending.append((*next_image, executor.submit(_read_file, next_image[1])))
+
+                try:
+                    data = memoryview(future.result())
+                    content_type = self._image_mime(image_path)
+                except Exception as e:
+                    print(f"⚠️ Не удалось добавить изображение {filename} в FB2: {e}")
+                    continue
+
+                if not first:
+                    f.write("\n")
+                first = False
+                f.write(f'<binary id={saxutils.quoteattr(filename)} content-type="{content_type}">')
+                for offset in range(0, len(data), _B64_CHUNK_SIZE):
+                    f.write(base64.b64encode(data[offset : offset + _B64_CHUNK_SIZE]).decode("ascii"))
+                f.write("</binary>")
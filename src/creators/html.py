@@ -3,81 +3,40 @@
 """
 
 import base64
+import hashlib
 import html as html_lib
+import io
 import mimetypes
 import os
-from typing import Any, Dict, List, Optional
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from bs4 import BeautifulSoup, Tag
+from lxml import html as lxml_html
 
-from ..settings import settings
-
-
-class HtmlCreator:
-    def __init__(self, processor):
-        self.processor = processor
-        self.parser = processor.parser
-
-    """Класс для создания HTML-файлов"""
-
-    @property
-    def format_name(self) -> str:
-        """Возвращает имя формата книги."""
-        return "HTML"
-
-    def create(
-        self,
-        novel_info: Dict[str, Any],
-        chapters_data: List[Dict[str, Any]],
-        selected_branch_id: Optional[str] = None,
-    ) -> str:
-        """Создание HTML файла с главами новеллы."""
-        _, image_folder = self.processor.file_manager.prepare_dirs(novel_info.get("id"))
-
-        prepared_chapters = self.processor.chapter_loader.prepare_chapters(
-            novel_info, chapters_data, selected_branch_id, image_folder
-        )
-        cover_filename = self.processor.chapter_loader.download_cover(novel_info, image_folder)
-
-        print(f"📦 Создание {self.format_name}...")
-
-        full_html = self._build_html_content(
-            novel_info, prepared_chapters, cover_filename, image_folder
-        )
+try:
+    import pybase64
 
-        title, _, _, _ = self.processor.metadata_extractor.extract_title_author_summary(novel_info)
-        html_filename = self.processor.file_manager.get_safe_filename(title, "html")
+    _b64_string = pybase64.b64encode_as_string
+except ImportError:
 
-        with open(html_filename, "w", encoding="utf-8") as f:
-            f.write(full_html)
+    def _b64_string(data: bytes) -> str:
+        return base64.b64encode(data).decode("ascii")
 
-        return html_filename
 
-    def _build_html_content(
-        self,
-        novel_info: Dict[str, Any],
-        prepared_chapters: List[Dict[str, Any]],
-        cover_filename: Optional[str],
-        image_folder: str,
-    ) -> str:
-        """Сборка полного HTML-содержимого книги."""
-        title, _, _, _ = self.processor.metadata_extractor.extract_title_author_summary(novel_info)
-
-        toc_html = self._create_toc_html(novel_info, prepared_chapters)
-        js_script = self._get_javascript()
-
-        head = self._create_html_head(title, js_script)
-        body_content = self._create_html_body(novel_info, prepared_chapters, cover_filename, toc_html)
-
-        embedded_body = self._embed_images_as_base64(body_content, image_folder)
+from ..branches import volume_sort_key
+from ..settings import settings
 
-        return f'<!DOCTYPE html>\n<html lang="ru">\n{head}\n{embedded_body}\n</html>'
+_IMAGE_READ_WORKERS = 4
+_WRITE_BUFFER_SIZE = 1024 * 1024
+_IMG_TAG_RE = re.compile(r"<img\b", re.IGNORECASE)
+_IMG_SRC_RE = re.compile(r"""(<img\b[^>]*?(?<![\w-])src\s*=\s*)(["'])(.*?)\2""", re.IGNORECASE | re.DOTALL)
 
-    def _create_html_head(self, title: str, js_script: str) -> str:
-        """Создание секции <head> для HTML-документа."""
-        decoded_title = html_lib.escape(self.parser.decode_html_entities(title))
+_TOC_ITEM_TEMPLATE = '\n<li><a href="#{id}">{title}</a></li>'
+_CHAPTER_TEMPLATE = '\n<div class="chapter" id="{id}">\n<h3 class="chapter-title">{title}</h3>\n{html}\n</div>'
 
-        style = """
+_CSS = """
 <style>
     :root {
         --bg-color: #f9f9f9; --text-color: #333; --header-color: #1a1a1a;
@@ -188,122 +147,7 @@ class HtmlCreator:
 </style>
 """
 
-        return (
-            "<head>\n"
-            f'<meta charset="UTF-8">\n'
-            f'<meta name="viewport" content="width=device-width, initial-scale=1.0">\n'
-            f"<title>{decoded_title}</title>\n"
-            f"{style}\n"
-            f"{js_script}\n"
-            "</head>"
-        )
-
-    def _create_html_body(
-        self,
-        novel_info: Dict[str, Any],
-        prepared_chapters: List[Dict[str, Any]],
-        cover_filename: Optional[str],
-        toc_html: str,
-    ) -> str:
-        """Создание содержимого для <body>."""
-        title, author, summary, _ = self.processor.metadata_extractor.extract_title_author_summary(novel_info)
-
-        controls = """
-<div id="controls-wrapper">
-    <div id="controls">
-        <button id="toggle-theme" title="Переключить тему">🌓</button>
-        <button id="toggle-toc" title="Оглавление">📖</button>
-    </div>
-</div>"""
-        sidebar = f'<nav id="toc-sidebar">{toc_html}</nav><div id="toc-overlay"></div>'
-
-        body_parts = [f"<body>{controls}{sidebar}"]
-
-        body_parts.append("<main>")
-        body_parts.append(f"<h1>{html_lib.escape(self.parser.decode_html_entities(title))}</h1>")
-        if author:
-            body_parts.append(f"<h2>{html_lib.escape(self.parser.decode_html_entities(author))}</h2>")
-        if cover_filename and self.processor.chapter_loader.download_cover_enabled:
-            body_parts.append(f'<div class="cover"><img src="images/{cover_filename}" alt="Обложка"></div>')
-
-        if summary:
-            body_parts.append(f'<div class="summary">{summary}</div>')
-
-        volume_chapters: Dict[str, List[Dict[str, Any]]] = {}
-        for chapter in prepared_chapters:
-            volume_chapters.setdefault(str(chapter["volume"]), []).append(chapter)
-
-        sorted_volumes = sorted(volume_chapters.keys(), key=lambda x: int(x) if x.isdigit() else 0)
-
-        total_volumes = self.processor.metadata_extractor.get_total_volume_count(novel_info)
-
-        for vol_num in sorted_volumes:
-            if settings.get("group_by_volumes") and total_volumes > 1:
-                body_parts.append(f'<h2 id="vol-{vol_num}">Том {vol_num}</h2>')
-
-            for prep in volume_chapters[vol_num]:
-                ch_name_decoded = self.parser.decode_html_entities(prep.get("name", "").strip())
-                chapter_title_raw = self.processor.chapter_formatter.format_chapter_title(
-                    ch_name_decoded, prep["number"], vol_num, total_volumes
-                )
-                chapter_title = html_lib.escape(chapter_title_raw)
-
-                chapter_id = f'ch-{prep["volume"]}-{prep["number"]}'
-                body_parts.append(f'<div class="chapter" id="{chapter_id}">')
-                body_parts.append(f'<h3 class="chapter-title">{chapter_title}</h3>')
-                body_parts.append(prep["html"])
-                body_parts.append("</div>")
-
-        body_parts.append("</main>")
-        body_parts.append("</body>")
-        return "\n".join(body_parts)
-
-    def _create_toc_html(
-        self, novel_info: Dict[str, Any], prepared_chapters: List[Dict[str, Any]]
-    ) -> str:
-        """Создание HTML для оглавления."""
-        header = """
-<div id="toc-header">
-    <svg class="back-arrow-svg" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 448 512"><path fill="currentColor" d="M9.4 233.4c-12.5 12.5-12.5 32.8 0 45.3l160 160c12.5 12.5 32.8 12.5 45.3 0s12.5-32.8 0-45.3L109.2 288 416 288c17.7 0 32-14.3 32-32s-14.3-32-32-32l-306.7 0L214.6 118.6c12.5-12.5 12.5-32.8 0-45.3s-32.8-12.5-45.3 0l-160 160z"></path></svg>
-    <h2>Оглавление</h2>
-</div>"""
-
-        volume_chapters: Dict[str, List[Dict[str, Any]]] = {}
-        for chapter in prepared_chapters:
-            volume_chapters.setdefault(str(chapter["volume"]), []).append(chapter)
-
-        sorted_volumes = sorted(volume_chapters.keys(), key=lambda x: int(x) if x.isdigit() else 0)
-
-        total_volumes = self.processor.metadata_extractor.get_total_volume_count(novel_info)
-
-        has_volumes = settings.get("group_by_volumes") and total_volumes > 1
-
-        toc_list_parts = ['<ul class="toc-main-list">']
-        for vol_num in sorted_volumes:
-            if has_volumes:
-                toc_list_parts.append(
-                    f'<li><div class="toc-volume-header open"><strong>Том {vol_num}</strong></div><ul class="toc-volume-chapters open">'
-                )
-
-            for prep in volume_chapters[vol_num]:
-                ch_name_decoded = self.parser.decode_html_entities(prep.get("name", "").strip())
-                chapter_title_raw = self.processor.chapter_formatter.format_chapter_title(
-                    ch_name_decoded, prep["number"], vol_num, total_volumes
-                )
-                chapter_title = html_lib.escape(chapter_title_raw)
-
-                chapter_id = f'ch-{prep["volume"]}-{prep["number"]}'
-                toc_list_parts.append(f'<li><a href="#{chapter_id}">{chapter_title}</a></li>')
-
-            if has_volumes:
-                toc_list_parts.append("</ul></li>")
-        toc_list_parts.append("</ul>")
-
-        return header + "\n" + "\n".join(toc_list_parts)
-
-    def _get_javascript(self) -> str:
-        """Возвращает строку с JS-кодом для интерактивности."""
-        return """
+_JS = """
 <script>
 document.addEventListener('DOMContentLoaded', () => {
     const body = document.body;
@@ -374,28 +218,255 @@ document.addEventListener('DOMContentLoaded', () => {
 });
 </script>"""
 
-    def _embed_images_as_base64(self, html_content: str, image_folder: str) -> str:
-        """Встраивание всех изображений в HTML как base64 data URI."""
-        soup = BeautifulSoup(html_content, "lxml")
-        for img in soup.find_all("img"):
-            if not isinstance(img, Tag) or not img.has_attr("src"):
-                continue
 
-            src_attr = img["src"]
-            src = str(src_attr[0] if isinstance(src_attr, list) else src_attr)
+class HtmlCreator:
+    def __init__(self, processor):
+        self.processor = processor
+        self.parser = processor.parser
 
-            if src.startswith("data:"):
-                continue
+    """Класс для создания HTML-файлов"""
+
+    @property
+    def format_name(self) -> str:
+        """Возвращает имя формата книги."""
+        return "HTML"
+
+    def create(
+        self,
+        novel_info: Dict[str, Any],
+        chapters_data: List[Dict[str, Any]],
+        selected_branch_id: Optional[str] = None,
+    ) -> str:
+        """Создание HTML файла с главами новеллы."""
+        _, image_folder = self.processor.file_manager.prepare_dirs(novel_info.get("id"))
+
+        prepared_chapters = self.processor.chapter_loader.prepare_chapters(
+            novel_info, chapters_data, selected_branch_id, image_folder
+        )
+        cover_filename = self.processor.chapter_loader.download_cover(novel_info, image_folder)
+
+        print(f"📦 Создание {self.format_name}...")
+
+        full_html = self._build_html_content(
+            novel_info, prepared_chapters, cover_filename, image_folder
+        )
 
-            filename = os.path.basename(src)
-            image_path = os.path.join(image_folder, filename)
+        title, _, _, _ = self.processor.metadata_extractor.extract_title_author_summary(novel_info)
+        html_filename = self.processor.file_manager.get_safe_filename(title, "html")
 
-            if os.path.exists(image_path):
-                mime_type = mimetypes.guess_type(image_path)[0] or "image/jpeg"
-                with open(image_path, "rb") as f:
-                    encoded_string = base64.b64encode(f.read()).decode("utf-8")
-                img["src"] = f"data:{mime_type};base64,{encoded_string}"
-            else:
-                print(f"⚠️ Изображение не найдено для встраивания: {image_path}")
+        with open(html_filename, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(full_html.encode("utf-8"))
+
+        return html_filename
+
+    def _build_html_content(
+        self,
+        novel_info: Dict[str, Any],
+        prepared_chapters: List[Dict[str, Any]],
+        cover_filename: Optional[str],
+        image_folder: str,
+    ) -> str:
+        """Сборка полного HTML-содержимого книги."""
+        title, _, _, _ = self.processor.metadata_extractor.extract_title_author_summary(novel_info)
+
+        toc_list_html, chapters_html = self._render_volumes(novel_info, prepared_chapters)
+        toc_html = self._create_toc_html(toc_list_html)
+        js_script = self._get_javascript()
 
-        return str(soup.body) if soup.body else str(soup)
\ No newline at end of file
+        head = self._create_html_head(title, js_script)
+        body_content = self._create_html_body(novel_info, chapters_html, cover_filename, toc_html)
+
+        embedded_body = self._embed_images_as_base64(body_content, image_folder)
+
+        return f'<!DOCTYPE html>\n<html lang="ru">\n{head}\n{embedded_body}\n</html>'
+
+    def _create_html_head(self, title: str, js_script: str) -> str:
+        """Создание секции <head> для HTML-документа."""
+        decoded_title = html_lib.escape(self.parser.decode_html_entities(title))
+
+        return (
+            "<head>\n"
+            f'<meta charset="UTF-8">\n'
+            f'<meta name="viewport" content="width=device-width, initial-scale=1.0">\n'
+            f"<title>{decoded_title}</title>\n"
+            f"{_CSS}\n"
+            f"{js_script}\n"
+            "</head>"
+        )
+
+    def _create_html_body(
+        self,
+        novel_info: Dict[str, Any],
+        chapters_html: str,
+        cover_filename: Optional[str],
+        toc_html: str,
+    ) -> str:
+        """Создание содержимого для <body>."""
+        title, author, summary, _ = self.processor.metadata_extractor.extract_title_author_summary(novel_info)
+
+        controls = """
+<div id="controls-wrapper">
+    <div id="controls">
+        <button id="toggle-theme" title="Переключить тему">🌓</button>
+        <button id="toggle-toc" title="Оглавление">📖</button>
+    </div>
+</div>"""
+        sidebar = f'<nav id="toc-sidebar">{toc_html}</nav><div id="toc-overlay"></div>'
+
+        buf = io.StringIO()
+        write = buf.write
+        write(f"<body>{controls}{sidebar}")
+
+        write("\n<main>")
+        write(f"\n<h1>{html_lib.escape(self.parser.decode_html_entities(title))}</h1>")
+        if author:
+            write(f"\n<h2>{html_lib.escape(self.parser.decode_html_entities(author))}</h2>")
+        if cover_filename and self.processor.chapter_loader.download_cover_enabled:
+            write(f'\n<div class="cover"><img src="images/{cover_filename}" alt="Обложка"></div>')
+
+        if summary:
+            write(f'\n<div class="summary">{summary}</div>')
+
+        write(chapters_html)
+        write("\n</main>")
+        write("\n</body>")
+        return buf.getvalue()
+
+    def _create_toc_html(self, toc_list_html: str) -> str:
+        """Создание HTML для оглавления."""
+        header = """
+<div id="toc-header">
+    <svg class="back-arrow-svg" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 448 512"><path fill="currentColor" d="M9.4 233.4c-12.5 12.5-12.5 32.8 0 45.3l160 160c12.5 12.5 32.8 12.5 45.3 0s12.5-32.8 0-45.3L109.2 288 416 288c17.7 0 32-14.3 32-32s-14.3-32-32-32l-306.7 0L214.6 118.6c12.5-12.5 12.5-32.8 0-45.3s-32.8-12.5-45.3 0l-160 160z"></path></svg>
+    <h2>Оглавление</h2>
+</div>"""
+
+        return header + "\n" + toc_list_html
+
+    def _render_volumes(
+        self, novel_info: Dict[str, Any], prepared_chapters: List[Dict[str, Any]]
+    ) -> Tuple[str, str]:
+        """Формирование списка оглавления и тела глав за один проход по томам."""
+        volume_chapters: Dict[str, List[Dict[str, Any]]] = {
+            volume: [] for volume in dict.fromkeys(chapter["volume"] for chapter in prepared_chapters)
+        }
+        for chapter in prepared_chapters:
+            volume_chapters[chapter["volume"]].append(chapter)
+
+        sorted_volumes = sorted(volume_chapters, key=volume_sort_key)
+
+        total_volumes = self.processor.metadata_extractor.get_total_volume_count(novel_info)
+
+        has_volumes = settings.get("group_by_volumes") and total_volumes > 1
+        self.processor.annotate_chapter_titles(prepared_chapters, total_volumes)
+        escape = html_lib.escape
+
+        toc_io = io.StringIO()
+        body_io = io.StringIO()
+        toc_write = toc_io.write
+        body_write = body_io.write
+        toc_item = _TOC_ITEM_TEMPLATE.format
+        chapter_block = _CHAPTER_TEMPLATE.format
+
+        toc_write('<ul class="toc-main-list">')
+        for vol_num in sorted_volumes:
+            if has_volumes:
+                toc_write(
+                    f'\n<li><div class="toc-volume-header open"><strong>Том {vol_num}</strong></div><ul class="toc-volume-chapters open">'
+                )
+                body_write(f'\n<h2 id="vol-{vol_num}">Том {vol_num}</h2>')
+
+            for prep in volume_chapters[vol_num]:
+                chapter_title = escape(prep["display_title"])
+                chapter_id = prep["anchor_id"]
+
+                toc_write(toc_item(id=chapter_id, title=chapter_title))
+                body_write(chapter_block(id=chapter_id, title=chapter_title, html=prep["html"]))
+
+            if has_volumes:
+                toc_write("\n</ul></li>")
+        toc_write("\n</ul>")
+
+        return toc_io.getvalue(), body_io.getvalue()
+
+    def _get_javascript(self) -> str:
+        """Возвращает строку с JS-кодом для интерактивности."""
+        return _JS
+
+    def _embed_images_as_base64(self, html_content: str, image_folder: str) -> str:
+        """Встраивание всех изображений в HTML как base64 data URI."""
+        srcs = [match.group(3) for match in _IMG_SRC_RE.finditer(html_content)]
+        if len(srcs) != len(_IMG_TAG_RE.findall(html_content)):
+            return self._embed_images_with_xpath(html_content, image_folder)
+
+        data_uris = self._encode_images(
+            {os.path.basename(src) for src in srcs if not src.startswith("data:")}, image_folder
+        )
+        if not data_uris:
+            return html_content
+
+        def _replace(match: "re.Match[str]") -> str:
+            src = match.group(3)
+            if src.startswith("data:"):
+                return match.group(0)
+
+            data_uri = data_uris.get(os.path.basename(src))
+            if data_uri is None:
+                return match.group(0)
+            return f"{match.group(1)}{match.group(2)}{data_uri}{match.group(2)}"
+
+        return _IMG_SRC_RE.sub(_replace, html_content)
+
+    def _embed_images_with_xpath(self, html_content: str, image_folder: str) -> str:
+        """Встраивание изображений через lxml XPath для разметки, не разобранной регулярным выражением."""
+        root = lxml_html.document_fromstring(html_content)
+        images = root.xpath('//img[@src and not(starts-with(@src, "data:"))]')
+
+        data_uris = self._encode_images({os.path.basename(img.get("src")) for img in images}, image_folder)
+        for img in images:
+            data_uri = data_uris.get(os.path.basename(img.get("src")))
+            if data_uri is not None:
+                img.set("src", data_uri)
+
+        return lxml_html.tostring(root.body, encoding="unicode")
+
+    def _encode_images(self, filenames: Set[str], image_folder: str) -> Dict[str, Optional[str]]:
+        """Параллельное чтение и кодирование изображений по именам файлов."""
+        if not filenames:
+            return {}
+
+        try:
+            with os.scandir(image_folder) as entries:
+                available = {entry.name: entry.path for entry in entries if entry.is_file()}
+        except OSError:
+            available = {}
+
+        names = sorted(filenames)
+        paths = []
+        for filename in names:
+            path = available.get(filename)
+            if path is None:
+                print(f"⚠️ Изображение не найдено для встраивания: {os.path.join(image_folder, filename)}")
+            paths.append(path)
+
+        encoded_by_hash: Dict[Tuple[str, str], str] = {}
+        encode = partial(self._encode_image, encoded_by_hash=encoded_by_hash)
+        with ThreadPoolExecutor(max_workers=min(_IMAGE_READ_WORKERS, len(paths))) as executor:
+            return dict(zip(names, executor.map(encode, paths)))
+
+    @staticmethod
+    def _encode_image(
+        image_path: Optional[str], encoded_by_hash: Dict[Tuple[str, str], str]
+    ) -> Optional[str]:
+        """Чтение изображения и формирование data URI (одинаковое содержимое кодируется один раз)."""
+        if image_path is None:
+            return None
+
+        mime_type = mimetypes.guess_type(image_path)[0] or "image/jpeg"
+        with open(image_path, "rb") as f:
+            data = f.read()
+
+        key = (mime_type, hashlib.md5(data, usedforsecurity=False).hexdigest())
+        data_uri = encoded_by_hash.get(key)
+        if data_uri is None:
+            data_uri = encoded_by_hash.setdefault(key, f"data:{mime_type};base64,{_b64_string(data)}")
+        return data_uri
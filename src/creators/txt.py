@@ -2,13 +2,44 @@
 Модуль для создания TXT файлов
 """
 
+import os
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
-from bs4 import BeautifulSoup
+from lxml import html as lxml_html
 
+from ..branches import volume_sort_key
 from ..settings import settings
 
+_WRITE_BUFFER_SIZE = 1024 * 1024
+_BLOCK_TAGS = ("p", "div", "h1", "h2", "h3", "h4", "h5", "h6", "li")
+_MULTI_NL = re.compile(r"\n{3,}")
+
+
+def _html_to_text(html: str) -> str:
+    """Преобразование HTML-содержимого в простой текст."""
+    if not html:
+        return ""
+    root = lxml_html.fragment_fromstring(html, create_parent="div")
+
+    for element in list(root.iter("img", "figure")):
+        element.drop_tree()
+
+    for br in root.iter("br"):
+        br.tail = "\n" + (br.tail or "")
+
+    for block in root.iter(*_BLOCK_TAGS):
+        block.text = "\n" + (block.text or "")
+        block.tail = "\n" + (block.tail or "")
+
+    text = root.text_content()
+
+    lines = [line.strip() for line in text.splitlines()]
+    non_empty_lines = [line for line in lines if line]
+    clean_text = "\n".join(non_empty_lines)
+
+    return _MULTI_NL.sub("\n\n", clean_text)
+
 
 class TxtCreator:
     def __init__(self, processor):
@@ -37,80 +68,57 @@ class TxtCreator:
 
         print(f"📦 Создание {self.format_name}...")
 
-        full_text = self._build_text_content(novel_info, prepared_chapters)
-
         title, _, _, _ = self.processor.metadata_extractor.extract_title_author_summary(novel_info)
         txt_filename = self.processor.file_manager.get_safe_filename(title, "txt")
 
-        with open(txt_filename, "w", encoding="utf-8") as f:
-            f.write(full_text)
+        try:
+            with open(txt_filename, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+                write = f.write
+                for chunk in self._iter_text_content(novel_info, prepared_chapters):
+                    write(chunk)
+        except BaseException:
+            if os.path.exists(txt_filename):
+                os.remove(txt_filename)
+            raise
 
         return txt_filename
 
-    def _build_text_content(self, novel_info: Dict[str, Any], prepared_chapters: List[Dict[str, Any]]) -> str:
-        """Сборка текстового содержимого книги."""
+    def _iter_text_content(
+        self, novel_info: Dict[str, Any], prepared_chapters: List[Dict[str, Any]]
+    ) -> Iterator[str]:
+        """Последовательная генерация текстового содержимого книги по частям."""
         title, author, _, _ = self.processor.metadata_extractor.extract_title_author_summary(novel_info)
 
-        lines = [title]
+        yield title
         if author:
-            lines.append(f"Автор: {author}")
-        lines.append("\n" + "=" * 60 + "\n")
+            yield f"\nАвтор: {author}"
+        yield "\n\n" + "=" * 60 + "\n"
 
-        volume_chapters: Dict[str, List[Dict[str, Any]]] = {}
+        volume_chapters: Dict[str, List[Dict[str, Any]]] = {
+            volume: [] for volume in dict.fromkeys(chapter["volume"] for chapter in prepared_chapters)
+        }
         for chapter in prepared_chapters:
-            volume_chapters.setdefault(str(chapter["volume"]), []).append(chapter)
+            volume_chapters[chapter["volume"]].append(chapter)
 
-        sorted_volumes = sorted(volume_chapters.keys(), key=lambda x: int(x) if x.isdigit() else 0)
+        sorted_volumes = sorted(volume_chapters, key=volume_sort_key)
 
         total_volumes = self.processor.metadata_extractor.get_total_volume_count(novel_info)
 
+        has_volumes = settings.get("group_by_volumes") and total_volumes > 1
+        self.processor.annotate_chapter_titles(prepared_chapters, total_volumes)
+        format_chapter = self._format_chapter_to_text
+
         for vol_num in sorted_volumes:
-            if settings.get("group_by_volumes") and total_volumes > 1:
-                lines.append(f"Том {vol_num}\n")
-                lines.append("-" * 60 + "\n")
+            if has_volumes:
+                yield f"\nТом {vol_num}\n"
+                yield "\n" + "-" * 60 + "\n"
 
             for prep in volume_chapters[vol_num]:
-                lines.append(self._format_chapter_to_text(prep, vol_num, total_volumes))
+                yield "\n"
+                yield format_chapter(prep)
 
-        return "\n".join(lines)
-
-    def _format_chapter_to_text(
-        self, prepared_chapter: Dict[str, Any], volume: str, total_volumes: int
-    ) -> str:
+    def _format_chapter_to_text(self, prepared_chapter: Dict[str, Any]) -> str:
         """Форматирование одной главы в текстовый блок."""
-        ch_name = self.parser.decode_html_entities(prepared_chapter.get("name", "").strip())
-        chapter_title = self.processor.chapter_formatter.format_chapter_title(
-            ch_name, prepared_chapter["number"], volume, total_volumes
-        )
-
-        html_content = prepared_chapter["html"]
-        plain_text = self._html_to_text(html_content)
-
-        return f"{chapter_title}\n\n{plain_text}\n\n"
-
-    def _html_to_text(self, html: str) -> str:
-        """Преобразование HTML-содержимого в простой текст."""
-        if not html:
-            return ""
-        soup = BeautifulSoup(html, "lxml")
-
-        for img in soup.find_all("img"):
-            img.decompose()
-
-        for figure in soup.find_all("figure"):
-            figure.decompose()
-
-        for br in soup.find_all("br"):
-            br.replace_with("\n")
-            
-        for block in soup.find_all(["p", "div", "h1", "h2", "h3", "h4", "h5", "h6", "li"]):
-            block.insert_before("\n")
-            block.insert_after("\n")
-
-        text = soup.get_text()
-
-        lines = [line.strip() for line in text.splitlines()]
-        non_empty_lines = [line for line in lines if line]
-        clean_text = "\n".join(non_empty_lines)
+        plain_text = _html_to_text(prepared_chapter["html"])
 
-        return re.sub(r"\n{3,}", "\n\n", clean_text) 
\ No newline at end of file
+        return f"{prepared_chapter['display_title']}\n\n{plain_text}\n\n"
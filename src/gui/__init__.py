@@ -2,6 +2,19 @@
 Модуль графического интерфейса для RanobeLIB
 """
 
-from .main_window import MainWindow
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["MainWindow"] 
\ No newline at end of file
+if TYPE_CHECKING:
+    from .main_window import MainWindow
+
+__all__ = ["MainWindow"]
+
+
+def __getattr__(name: str) -> Any:
+    """Ленивая загрузка главного окна при первом обращении (PEP 562)."""
+    if name == "MainWindow":
+        from .main_window import MainWindow
+
+        globals()[name] = MainWindow
+        return MainWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
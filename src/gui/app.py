@@ -3,12 +3,54 @@
 """
 
 import sys
+from functools import cache
 
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor, QPalette
 from PyQt6.QtWidgets import QApplication
 
-from .main_window import MainWindow
+_DARK_COLOR = (45, 45, 45)
+_DISABLED_COLOR = (70, 70, 70)
+_TEXT_COLOR = (200, 200, 200)
+_HIGHLIGHT_COLOR = (42, 130, 218)
+
+_DARK_PALETTE_ROLES = (
+    (QPalette.ColorRole.Window, _DARK_COLOR),
+    (QPalette.ColorRole.WindowText, _TEXT_COLOR),
+    (QPalette.ColorRole.Base, (25, 25, 25)),
+    (QPalette.ColorRole.AlternateBase, _DARK_COLOR),
+    (QPalette.ColorRole.ToolTipBase, _DARK_COLOR),
+    (QPalette.ColorRole.ToolTipText, _TEXT_COLOR),
+    (QPalette.ColorRole.Text, _TEXT_COLOR),
+    (QPalette.ColorRole.Button, _DARK_COLOR),
+    (QPalette.ColorRole.ButtonText, _TEXT_COLOR),
+    (QPalette.ColorRole.BrightText, Qt.GlobalColor.red),
+    (QPalette.ColorRole.Link, _HIGHLIGHT_COLOR),
+    (QPalette.ColorRole.Highlight, _HIGHLIGHT_COLOR),
+    (QPalette.ColorRole.HighlightedText, Qt.GlobalColor.black),
+)
+
+_DISABLED_PALETTE_ROLES = (
+    QPalette.ColorRole.WindowText,
+    QPalette.ColorRole.Text,
+    QPalette.ColorRole.ButtonText,
+)
+
+
+@cache
+def _dark_palette() -> QPalette:
+    """Тёмная палитра приложения (создаётся один раз)."""
+    palette = QPalette()
+    set_color = palette.setColor
+
+    for role, color in _DARK_PALETTE_ROLES:
+        set_color(role, QColor(*color) if isinstance(color, tuple) else color)
+
+    disabled_color = QColor(*_DISABLED_COLOR)
+    for role in _DISABLED_PALETTE_ROLES:
+        set_color(QPalette.ColorGroup.Disabled, role, disabled_color)
+
+    return palette
 
 
 def run_gui():
@@ -23,35 +65,11 @@ def run_gui():
     app.setOrganizationName("RanobeLIB")
 
     app.setStyle("Fusion")
+    app.setPalette(_dark_palette())
 
-    dark_palette = QPalette()
-
-    dark_color = QColor(45, 45, 45)
-    disabled_color = QColor(70, 70, 70)
-    text_color = QColor(200, 200, 200)
-    highlight_color = QColor(42, 130, 218)
-
-    dark_palette.setColor(QPalette.ColorRole.Window, dark_color)
-    dark_palette.setColor(QPalette.ColorRole.WindowText, text_color)
-    dark_palette.setColor(QPalette.ColorRole.Base, QColor(25, 25, 25))
-    dark_palette.setColor(QPalette.ColorRole.AlternateBase, dark_color)
-    dark_palette.setColor(QPalette.ColorRole.ToolTipBase, dark_color)
-    dark_palette.setColor(QPalette.ColorRole.ToolTipText, text_color)
-    dark_palette.setColor(QPalette.ColorRole.Text, text_color)
-    dark_palette.setColor(QPalette.ColorRole.Button, dark_color)
-    dark_palette.setColor(QPalette.ColorRole.ButtonText, text_color)
-    dark_palette.setColor(QPalette.ColorRole.BrightText, Qt.GlobalColor.red)
-    dark_palette.setColor(QPalette.ColorRole.Link, highlight_color)
-    dark_palette.setColor(QPalette.ColorRole.Highlight, highlight_color)
-    dark_palette.setColor(QPalette.ColorRole.HighlightedText, Qt.GlobalColor.black)
-
-    dark_palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.WindowText, disabled_color)
-    dark_palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Text, disabled_color)
-    dark_palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.ButtonText, disabled_color)
-
-    app.setPalette(dark_palette)
+    from .main_window import MainWindow
 
     main_window = MainWindow()
     main_window.show()
 
-    return app.exec() 
\ No newline at end of file
+    return app.exec() 
@@ -3,11 +3,13 @@
 """
 
 import base64
-from typing import Any, Callable, Dict, Optional
+from functools import cache
+from typing import Any, Callable, Dict, Optional, Tuple
 from urllib.parse import parse_qs, urlparse
 
-from PyQt6.QtCore import QObject, QPoint, QSize, Qt, QThread, pyqtSignal, QUrl
-from PyQt6.QtGui import QIcon, QPainter, QPainterPath, QPixmap
+from PyQt6.QtCore import QCoreApplication, QObject, QPoint, QSize, Qt, QThread, QThreadPool, QTimer, pyqtSignal, QUrl
+from PyQt6.QtGui import QBrush, QIcon, QPainter, QPixmap
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
 from PyQt6.QtWidgets import QLabel, QMenu, QMessageBox, QPushButton, QVBoxLayout, QWidget, QWidgetAction, QDialog
 
 try:
@@ -20,6 +22,35 @@ except ImportError:
 from ..api import RanobeLibAPI
 from ..auth import RanobeLibAuth
 
+AVATAR_TIMEOUT_MS = 10000
+AVATAR_CORNER_RADIUS = 4
+AVATAR_MENU_SIZE = 96
+AVATAR_FORWARDED_HEADERS = ("User-Agent", "Referer", "Origin")
+
+_shared_fetcher: Optional["AvatarFetcher"] = None
+
+_AUTH_ICON_B64 = "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAAsTAAALEwEAmpwYAAAB60lEQVR4nO2WPUtcQRSGV1dtNohoKm1NxK+AWmkpliopJHVA8QekMAgqWkWLIEhE0EAKLbVQBH9E7GIiIX40VkJUokJIJI8c9r0w4Me9ce/OtbgvDFxm3nPOw+7MnMlkUqVKlSoD5ICXwBsN+849BrAyYBw456Zsbsw8ScFVAFsO0G9gW8O+A5mnIgnADwL4B0wDlc5aJTCjNdOcb7gG4ErFR+7xvZXnL/DMJ+CECu8B2Xt8WWBf3jGfgGsqOh/BuyDvqh+6fNHgcLyL4J0ODosfunzRjyq6EcG7Ke+iH7p80Vcq+gd4HnKYzGMa8AlYDvxQ4S9A7S2eOmBHnu8W4w1QAF3OhXyqvdYH9OsOPHUu8E6vcA5kN3DM3bK17kTgHMgq9dxt9V8bnzVXlTTcU2AIWAd2gQuNXc0NAjVJgD0BpgQTJvtFJy3GF1w98M0BOAGWgWGgV8O+V7QW6KvFFhuuGfipgpfaZ7mQh+y4vCi2qZj7LWj8R0D7f8R2KCZ4YFQXA/CTCvwCWh8Q3wicKcdS3HAtzvvvdQF5BpXjKta/GphVYmtdpQXkyeqwmN7HCXgQ9nqOKmBUuQ4jB4UkrHGuirYY8nU4+Qo/LMCLOBOSvw0CtcTVa3s0SmLIV+LkS7ZXp0qVKlXm8esa/AZWqgtB6iwAAAAASUVORK5CYII="
+
+
+@cache
+def _get_auth_icon() -> QIcon:
+    """Иконка кнопки входа (декодируется один раз)."""
+    pixmap = QPixmap()
+    pixmap.loadFromData(base64.b64decode(_AUTH_ICON_B64))
+    return QIcon(pixmap)
+
+
+def _downscale_avatar(avatar_pixmap: QPixmap) -> QPixmap:
+    """Однократное уменьшение исходного аватара до наибольшего используемого размера."""
+    if min(avatar_pixmap.width(), avatar_pixmap.height()) <= AVATAR_MENU_SIZE:
+        return avatar_pixmap
+    return avatar_pixmap.scaled(
+        AVATAR_MENU_SIZE,
+        AVATAR_MENU_SIZE,
+        Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+        Qt.TransformationMode.SmoothTransformation,
+    )
+
 
 class TokenValidateWorker(QThread):
     """Рабочий поток для проверки сохраненного токена"""
@@ -41,57 +72,70 @@ class TokenValidateWorker(QThread):
             self.finished.emit(False, {}, f"Ошибка при проверке токена: {str(e)}")
 
 
-class AuthWorker(QThread):
-    """Рабочий поток для авторизации"""
-
-    auth_finished = pyqtSignal(bool, str)
+class AvatarFetcher(QObject):
+    """Асинхронная загрузка изображений через общий QNetworkAccessManager"""
 
-    def __init__(self, auth: RanobeLibAuth, auth_data: Dict[str, str], parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.auth = auth
-        self.auth_data = auth_data
+        self._nam = QNetworkAccessManager(self)
+        self._pending: Dict[QNetworkReply, Tuple[Callable[[QPixmap], None], Callable[[str], None]]] = {}
 
-    def run(self):
-        """Запуск процесса авторизации"""
+    def fetch(
+        self,
+        url: str,
+        on_ok: Callable[[QPixmap], None],
+        on_err: Callable[[str], None],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Запуск загрузки изображения; результат передается в on_ok или on_err."""
+        request = QNetworkRequest(QUrl(url))
+        request.setTransferTimeout(AVATAR_TIMEOUT_MS)
+        for name, value in (headers or {}).items():
+            request.setRawHeader(name.encode("latin-1"), value.encode("latin-1"))
+
+        reply = self._nam.get(request)
+        self._pending[reply] = (on_ok, on_err)
+        reply.finished.connect(lambda: self._on_finished(reply))
+
+    def _on_finished(self, reply: QNetworkReply) -> None:
+        """Обработка завершенного запроса."""
+        on_ok, on_err = self._pending.pop(reply)
         try:
-            token = self.auth.finish_authorization(self.auth_data)
-            if token:
-                self.auth_finished.emit(True, "Авторизация успешна")
-            else:
-                self.auth_finished.emit(False, "Не удалось получить токен")
-        except Exception as e:
-            self.auth_finished.emit(False, str(e))
+            if reply.error() != QNetworkReply.NetworkError.NoError:
+                on_err(reply.errorString())
+                return
 
+            pixmap = QPixmap()
+            if not pixmap.loadFromData(reply.readAll()):
+                on_err("Не удалось создать QPixmap из полученных данных")
+                return
+            on_ok(pixmap)
+        finally:
+            reply.deleteLater()
 
-class AvatarLoader(QThread):
-    """Рабочий поток для асинхронной загрузки аватара"""
 
-    finished = pyqtSignal(QPixmap)
-    error = pyqtSignal(str)
-
-    def __init__(self, url: str, session, parent=None):
-        super().__init__(parent)
-        self.url = url
-        self.session = session
-
-    def run(self):
-        """Запуск загрузки изображения."""
-        try:
-            response = self.session.get(self.url, timeout=10)
-            response.raise_for_status()
-            pixmap = QPixmap()
-            if not pixmap.loadFromData(response.content):
-                raise ValueError("Не удалось создать QPixmap из полученных данных")
-            self.finished.emit(pixmap)
-        except Exception as e:
-            self.error.emit(str(e))
+def shared_avatar_fetcher() -> AvatarFetcher:
+    """Общий для приложения загрузчик аватаров (одно пуловое соединение на хост)."""
+    global _shared_fetcher
+    if _shared_fetcher is None:
+        _shared_fetcher = AvatarFetcher(QCoreApplication.instance())
+    return _shared_fetcher
 
 
 class SilentWebEnginePage(QWebEnginePage if QWebEnginePage else object):
     """Кастомная страница для отключения вывода JS предупреждений в консоль."""
+
+    redirect_handler: Optional[Callable[[QUrl], bool]] = None
+
     def javaScriptConsoleMessage(self, level, message, lineNumber, sourceID):
         pass
 
+    def acceptNavigationRequest(self, url, navigation_type, is_main_frame):
+        """Перехват навигации до загрузки страницы (в т.ч. серверных редиректов)."""
+        if is_main_frame and self.redirect_handler and self.redirect_handler(url):
+            return False
+        return super().acceptNavigationRequest(url, navigation_type, is_main_frame)
+
 
 class WebAuthDialog(QDialog):
     """Диалог авторизации через встроенный браузер."""
@@ -103,6 +147,7 @@ class WebAuthDialog(QDialog):
         self.setWindowTitle("Авторизация RanobeLIB")
         self.resize(650, 750)
         self.redirect_uri = redirect_uri
+        self._code_captured = False
         
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)
@@ -110,6 +155,7 @@ class WebAuthDialog(QDialog):
         if QWebEngineView is not None:
             self.web_view = QWebEngineView(self)
             self.page = SilentWebEnginePage(self.web_view)
+            self.page.redirect_handler = self._capture_code
             self.web_view.setPage(self.page)
             self.layout.addWidget(self.web_view)
             
@@ -120,14 +166,31 @@ class WebAuthDialog(QDialog):
         
     def _on_url_changed(self, url: QUrl):
         """Отслеживает изменение URL для перехвата редиректа с кодом."""
+        self._capture_code(url)
+
+    def _capture_code(self, url: QUrl) -> bool:
+        """Перехватывает редирект с кодом; возвращает True, если код получен."""
+        if self._code_captured:
+            return True
         current_url = url.toString()
-        if current_url.startswith(self.redirect_uri):
-            parsed_url = urlparse(current_url)
-            query_params = parse_qs(parsed_url.query)
-            code = query_params.get("code", [None])[0]
-            if code:
-                self.code_received.emit(code)
-                self.accept()
+        if not current_url.startswith(self.redirect_uri):
+            return False
+
+        code = parse_qs(urlparse(current_url).query).get("code", [None])[0]
+        if not code:
+            return False
+
+        self._code_captured = True
+        self.web_view.urlChanged.disconnect(self._on_url_changed)
+        self.page.redirect_handler = None
+        QTimer.singleShot(0, lambda: self._finish_capture(code))
+        return True
+
+    def _finish_capture(self, code: str) -> None:
+        """Остановка загрузки и закрытие диалога вне обработчика навигации WebEngine."""
+        self.web_view.stop()
+        self.code_received.emit(code)
+        self.accept()
 
 
 class AuthManager(QObject):
@@ -135,17 +198,26 @@ class AuthManager(QObject):
 
     auth_changed = pyqtSignal()
     status_message = pyqtSignal(str, int)
+    _auth_finished = pyqtSignal(bool, str)
 
     def __init__(self, api: RanobeLibAPI, auth: RanobeLibAuth, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.api = api
         self.auth = auth
         self.user_data: Dict[str, Any] = {}
-        self.avatar_worker: Optional[AvatarLoader] = None
-        self.auth_worker: Optional[AuthWorker] = None
+        self.avatar_fetcher = shared_avatar_fetcher()
+        self._auth_in_progress = False
+        self._pending_status: Optional[Tuple[str, int]] = None
+        self._login_flush_scheduled = False
+        self._auth_finished.connect(self._on_auth_finished)
         self.token_validate_worker: Optional[TokenValidateWorker] = None
         self.parent_widget = parent
         self.raw_avatar_pixmap: Optional[QPixmap] = None
+        self._avatar_cache: Dict[Tuple[int, int], QPixmap] = {}
+        self._authed_menu: Optional[QMenu] = None
+        self._unauth_menu: Optional[QMenu] = None
+        self._menu_avatar_label: Optional[QLabel] = None
+        self._menu_username_label: Optional[QLabel] = None
 
         self._load_saved_token()
 
@@ -154,7 +226,22 @@ class AuthManager(QObject):
         self.auth.logout()
         self.user_data = {}
         self.raw_avatar_pixmap = None
-        self.status_message.emit("Выход из системы выполнен", 3000)
+        self._avatar_cache.clear()
+        self._queue_login_state("Выход из системы выполнен", 3000)
+
+    def _queue_login_state(self, message: str, timeout: int) -> None:
+        """Отложенная публикация статуса и смены авторизации одним проходом цикла событий."""
+        self._pending_status = (message, timeout)
+        if not self._login_flush_scheduled:
+            self._login_flush_scheduled = True
+            QTimer.singleShot(0, self._flush_login_state)
+
+    def _flush_login_state(self) -> None:
+        """Отправка накопленного статуса и сигнала auth_changed."""
+        self._login_flush_scheduled = False
+        pending, self._pending_status = self._pending_status, None
+        if pending:
+            self.status_message.emit(*pending)
         self.auth_changed.emit()
 
     def _load_saved_token(self):
@@ -170,21 +257,22 @@ class AuthManager(QObject):
         """Обработка результатов проверки токена."""
         if success:
             self.user_data = user_data
-            self.status_message.emit(message, 3000)
-            self.auth_changed.emit()
+            self._queue_login_state(message, 3000)
         else:
             self.status_message.emit(message, 5000)
         self.token_validate_worker = None
 
     def show_auth_menu(self, button: QPushButton):
         """Показывает всплывающее меню в зависимости от состояния авторизации."""
-        menu = QMenu(self.parent_widget)
-        menu.setObjectName("authMenu")
-
         if self.is_authenticated():
-            self._create_authenticated_menu(menu, button)
+            if self._authed_menu is None:
+                self._authed_menu = self._create_authenticated_menu()
+            menu = self._authed_menu
+            self._refresh_authenticated_menu()
         else:
-            self._create_unauthenticated_menu(menu)
+            if self._unauth_menu is None:
+                self._unauth_menu = self._create_unauthenticated_menu()
+            menu = self._unauth_menu
 
         menu_width = menu.sizeHint().width()
         button_global_pos = button.mapToGlobal(QPoint(0, 0))
@@ -194,8 +282,11 @@ class AuthManager(QObject):
 
         menu.exec(QPoint(x, y))
 
-    def _create_unauthenticated_menu(self, menu: QMenu):
+    def _create_unauthenticated_menu(self) -> QMenu:
         """Создает меню для неавторизованного пользователя."""
+        menu = QMenu(self.parent_widget)
+        menu.setObjectName("authMenu")
+
         info_widget = QWidget()
         info_layout = QVBoxLayout(info_widget)
         info_layout.setContentsMargins(10, 10, 10, 10)
@@ -225,9 +316,13 @@ class AuthManager(QObject):
         login_action = QWidgetAction(menu)
         login_action.setDefaultWidget(button_container)
         menu.addAction(login_action)
+        return menu
 
-    def _create_authenticated_menu(self, menu: QMenu, button: QPushButton):
+    def _create_authenticated_menu(self) -> QMenu:
         """Создает меню для авторизованного пользователя."""
+        menu = QMenu(self.parent_widget)
+        menu.setObjectName("authMenu")
+
         user_widget = QWidget()
         user_layout = QVBoxLayout(user_widget)
         user_layout.setContentsMargins(10, 10, 10, 10)
@@ -235,13 +330,12 @@ class AuthManager(QObject):
         user_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         avatar_label = QLabel()
-        avatar_label.setFixedSize(96, 96)
+        avatar_label.setFixedSize(AVATAR_MENU_SIZE, AVATAR_MENU_SIZE)
         avatar_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         avatar_label.setStyleSheet("border: 2px solid #555555; border-radius: 5px;")
-        self.load_avatar(avatar_label)
         user_layout.addWidget(avatar_label)
 
-        username_label = QLabel(self.get_username())
+        username_label = QLabel()
         username_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         username_label.setStyleSheet("font-weight: bold; background-color: transparent;")
         user_layout.addWidget(username_label)
@@ -266,9 +360,22 @@ class AuthManager(QObject):
         logout_action.setDefaultWidget(button_container)
         menu.addAction(logout_action)
 
+        self._menu_avatar_label = avatar_label
+        self._menu_username_label = username_label
+        return menu
+
+    def _refresh_authenticated_menu(self) -> None:
+        """Обновление имени и аватара в постоянном меню перед показом."""
+        username = self.get_username()
+        if self._menu_username_label.text() != username:
+            self._menu_username_label.setText(username)
+        if self.raw_avatar_pixmap is None:
+            self._menu_avatar_label.clear()
+        self.load_avatar(self._menu_avatar_label)
+
     def start_auth_process(self):
         """Запуск процесса авторизации."""
-        if self.auth_worker and self.auth_worker.isRunning():
+        if self._auth_in_progress:
             self.status_message.emit("Процесс авторизации уже запущен", 3000)
             return
 
@@ -285,9 +392,8 @@ class AuthManager(QObject):
             def on_code_received(code: str):
                 auth_details["code"] = code
                 self.status_message.emit("Код авторизации получен, обмен на токен...", 0)
-                self.auth_worker = AuthWorker(self.auth, auth_details)
-                self.auth_worker.auth_finished.connect(self._on_auth_finished)
-                self.auth_worker.start()
+                self._auth_in_progress = True
+                QThreadPool.globalInstance().start(lambda: self._finish_authorization(auth_details))
 
             dialog.code_received.connect(on_code_received)
             
@@ -297,17 +403,27 @@ class AuthManager(QObject):
             self.status_message.emit("Ошибка инициализации окна авторизации. Убедитесь, что установлен PyQt6-WebEngine.", 5000)
             print(f"Ошибка импорта WebAuthDialog: {e}")
 
+    def _finish_authorization(self, auth_data: Dict[str, str]) -> None:
+        """Обмен кода авторизации на токен (выполняется в пуле потоков)."""
+        try:
+            token = self.auth.finish_authorization(auth_data)
+            if token:
+                self._auth_finished.emit(True, "Авторизация успешна")
+            else:
+                self._auth_finished.emit(False, "Не удалось получить токен")
+        except Exception as e:
+            self._auth_finished.emit(False, str(e))
+
     def _on_auth_finished(self, success: bool, message: str):
         """Обработка завершения авторизации."""
         if success:
             self.user_data = self.api.get_current_user()
-            self.status_message.emit("Авторизация прошла успешно!", 3000)
-            self.auth_changed.emit()
+            self._queue_login_state("Авторизация прошла успешно!", 3000)
         else:
             self.status_message.emit(f"Ошибка авторизации: {message}", 5000)
             QMessageBox.critical(self.parent_widget, "Ошибка авторизации", message)
 
-        self.auth_worker = None
+        self._auth_in_progress = False
 
     def is_authenticated(self) -> bool:
         """Проверка состояния авторизации."""
@@ -323,6 +439,35 @@ class AuthManager(QObject):
             return self.user_data["avatar"].get("url")
         return None
 
+    def _get_rounded_avatar(self, avatar_pixmap: QPixmap, widget_size: int) -> QPixmap:
+        """Масштабированный и скругленный аватар нужного размера (кешируется)."""
+        key = (id(avatar_pixmap), widget_size)
+        cached = self._avatar_cache.get(key)
+        if cached is not None:
+            return cached
+
+        scaled_pixmap = avatar_pixmap.scaled(
+            widget_size,
+            widget_size,
+            Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+        rounded_pixmap = QPixmap(scaled_pixmap.size())
+        rounded_pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(rounded_pixmap)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setBrush(QBrush(scaled_pixmap))
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.drawRoundedRect(
+            0, 0, scaled_pixmap.width(), scaled_pixmap.height(), AVATAR_CORNER_RADIUS, AVATAR_CORNER_RADIUS
+        )
+        painter.end()
+
+        self._avatar_cache[key] = rounded_pixmap
+        return rounded_pixmap
+
     def _process_and_set_avatar(
         self,
         avatar_pixmap: QPixmap,
@@ -338,28 +483,13 @@ class AuthManager(QObject):
         if widget_size <= 0:
             widget_size = 30
 
-        target_widget.setFixedSize(widget_size, widget_size)
-
-        scaled_pixmap = avatar_pixmap.scaled(
-            widget_size,
-            widget_size,
-            Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-            Qt.TransformationMode.SmoothTransformation,
-        )
-        rounded_pixmap = QPixmap(scaled_pixmap.size())
-        rounded_pixmap.fill(Qt.GlobalColor.transparent)
+        if target_widget.width() != widget_size or target_widget.height() != widget_size:
+            target_widget.setFixedSize(widget_size, widget_size)
 
-        painter = QPainter(rounded_pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        path = QPainterPath()
-        path.addRoundedRect(0, 0, scaled_pixmap.width(), scaled_pixmap.height(), 4, 4)
-        painter.setClipPath(path)
-        painter.drawPixmap(0, 0, scaled_pixmap)
-        painter.end()
+        rounded_pixmap = self._get_rounded_avatar(avatar_pixmap, widget_size)
 
         if isinstance(target_widget, QPushButton):
-            target_widget.setEnabled(True)
-            target_widget.setText("")
+            self._reset_button_visual(target_widget)
             target_widget.setIcon(QIcon(rounded_pixmap))
             target_widget.setIconSize(QSize(widget_size - 6, widget_size - 6))
             target_widget.setToolTip(f"{self.get_username()}")
@@ -369,6 +499,14 @@ class AuthManager(QObject):
         if on_complete:
             on_complete()
 
+    @staticmethod
+    def _reset_button_visual(button: QPushButton) -> None:
+        """Снятие заглушки загрузки с кнопки без лишних перерасчетов стиля."""
+        if not button.isEnabled():
+            button.setEnabled(True)
+        if button.text():
+            button.setText("")
+
     def load_avatar(
         self,
         target_widget: QLabel | QPushButton,
@@ -377,6 +515,14 @@ class AuthManager(QObject):
     ) -> None:
         """Загрузка аватара пользователя и установка его на виджет (кнопку или метку)."""
         if self.raw_avatar_pixmap:
+            if isinstance(target_widget, QLabel):
+                widget_size = height or target_widget.height()
+                cached = self._avatar_cache.get((id(self.raw_avatar_pixmap), widget_size))
+                if cached is not None and target_widget.width() == widget_size:
+                    target_widget.setPixmap(cached)
+                    if on_complete:
+                        on_complete()
+                    return
             self._process_and_set_avatar(self.raw_avatar_pixmap, target_widget, on_complete, height)
             return
 
@@ -390,21 +536,20 @@ class AuthManager(QObject):
                 target_widget.setFixedSize(height, height)
             target_widget.setEnabled(False)
 
-        self.avatar_worker = AvatarLoader(avatar_url, self.api.session)
-
         def on_avatar_loaded(avatar_pixmap: QPixmap):
             """Обработка успешной загрузки аватара."""
             if not target_widget:
                 return
 
-            self.raw_avatar_pixmap = avatar_pixmap
-            self._process_and_set_avatar(avatar_pixmap, target_widget, on_complete, height)
+            self.raw_avatar_pixmap = _downscale_avatar(avatar_pixmap)
+            self._avatar_cache.clear()
+            self._process_and_set_avatar(self.raw_avatar_pixmap, target_widget, on_complete, height)
 
         def on_avatar_error(error_message: str):
             """Обработка ошибки загрузки аватара."""
             print(f"Ошибка загрузки аватара: {error_message}")
             if isinstance(target_widget, QPushButton):
-                target_widget.setEnabled(True)
+                self._reset_button_visual(target_widget)
 
                 username = self.get_username()
                 first_letter = username[0].upper() if username else "?"
@@ -422,9 +567,9 @@ class AuthManager(QObject):
             if on_complete:
                 on_complete()
 
-        self.avatar_worker.finished.connect(on_avatar_loaded)
-        self.avatar_worker.error.connect(on_avatar_error)
-        self.avatar_worker.start()
+        session_headers = self.api.session.headers
+        headers = {name: session_headers[name] for name in AVATAR_FORWARDED_HEADERS if name in session_headers}
+        self.avatar_fetcher.fetch(avatar_url, on_avatar_loaded, on_avatar_error, headers)
 
     def configure_auth_button(self, button: QPushButton, input_height: int) -> None:
         """Настройка кнопки авторизации в зависимости от состояния входа."""
@@ -434,11 +579,7 @@ class AuthManager(QObject):
             button.setEnabled(True)
             button.setText("")
 
-            base64_icon = "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAAsTAAALEwEAmpwYAAAB60lEQVR4nO2WPUtcQRSGV1dtNohoKm1NxK+AWmkpliopJHVA8QekMAgqWkWLIEhE0EAKLbVQBH9E7GIiIX40VkJUokJIJI8c9r0w4Me9ce/OtbgvDFxm3nPOw+7MnMlkUqVKlSoD5ICXwBsN+849BrAyYBw456Zsbsw8ScFVAFsO0G9gW8O+A5mnIgnADwL4B0wDlc5aJTCjNdOcb7gG4ErFR+7xvZXnL/DMJ+CECu8B2Xt8WWBf3jGfgGsqOh/BuyDvqh+6fNHgcLyL4J0ODosfunzRjyq6EcG7Ke+iH7p80Vcq+gd4HnKYzGMa8AlYDvxQ4S9A7S2eOmBHnu8W4w1QAF3OhXyqvdYH9OsOPHUu8E6vcA5kN3DM3bK17kTgHMgq9dxt9V8bnzVXlTTcU2AIWAd2gQuNXc0NAjVJgD0BpgQTJvtFJy3GF1w98M0BOAGWgWGgV8O+V7QW6KvFFhuuGfipgpfaZ7mQh+y4vCi2qZj7LWj8R0D7f8R2KCZ4YFQXA/CTCvwCWh8Q3wicKcdS3HAtzvvvdQF5BpXjKta/GphVYmtdpQXkyeqwmN7HCXgQ9nqOKmBUuQ4jB4UkrHGuirYY8nU4+Qo/LMCLOBOSvw0CtcTVa3s0SmLIV+LkS7ZXp0qVKlXm8esa/AZWqgtB6iwAAAAASUVORK5CYII="
-            pixmap = QPixmap()
-            pixmap.loadFromData(base64.b64decode(base64_icon))
-            icon = QIcon(pixmap)
-            button.setIcon(icon)
+            button.setIcon(_get_auth_icon())
 
             button_size = input_height
             if button_size <= 0:
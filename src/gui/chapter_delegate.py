@@ -3,14 +3,22 @@
 """
 
 import re
-from typing import Dict
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QColor, QFont, QPalette
+from PyQt6.QtCore import QPointF, QRect, Qt
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPalette, QStaticText, QTransform
 from PyQt6.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionViewItem
 
 SINGLE_LINE_ITEM_ROLE = Qt.ItemDataRole.UserRole + 1
 TEAM_NAME_ROLE = Qt.ItemDataRole.UserRole + 2
+PART1_ROLE = Qt.ItemDataRole.UserRole + 3
+PART2_ROLE = Qt.ItemDataRole.UserRole + 4
+
+_ADVANCE_CACHE_SIZE = 4096
+_STATIC_TEXT_CACHE_SIZE = 1024
+_TEAM_SEPARATOR = "    "
+_TITLE_RE = re.compile(r"^(.*) (\[.*\])$")
 
 
 class ChapterItemDelegate(QStyledItemDelegate):
@@ -18,11 +26,73 @@ class ChapterItemDelegate(QStyledItemDelegate):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.team_colors = {}
+        self.team_colors: Dict[str, QColor] = {}
+        self._font_cache: Dict[Tuple[str, bool], QFont] = {}
+        self._last_font: Optional[QFont] = None
+        self._last_font_key = ""
+        self._advance_cache: Dict[Tuple[str, bool, str], int] = {}
+        self._static_cache: "OrderedDict[Tuple[str, bool, str], QStaticText]" = OrderedDict()
 
     def set_team_colors(self, colors: Dict[str, str]):
         """Установка словаря цветов для команд."""
-        self.team_colors = colors
+        self.team_colors = {team: QColor(color) for team, color in colors.items() if color}
+
+    def _font_key(self, font: QFont) -> str:
+        """Строковый ключ шрифта; для повторяющегося шрифта строк не пересчитывается."""
+        if self._last_font is None or font != self._last_font:
+            self._last_font = QFont(font)
+            self._last_font_key = font.toString()
+        return self._last_font_key
+
+    def _font_variant(self, font: QFont, font_key: str, italic: bool) -> QFont:
+        """Копия шрифта с нужным начертанием (кешируется по описанию шрифта)."""
+        key = (font_key, italic)
+        variant = self._font_cache.get(key)
+        if variant is None:
+            variant = QFont(font)
+            variant.setItalic(italic)
+            self._font_cache[key] = variant
+        return variant
+
+    def _text_advance(self, metrics: QFontMetrics, font_key: str, text: str, italic: bool = False) -> int:
+        """Ширина текста для шрифта (кешируется)."""
+        key = (font_key, italic, text)
+        advance = self._advance_cache.get(key)
+        if advance is None:
+            if len(self._advance_cache) >= _ADVANCE_CACHE_SIZE:
+                self._advance_cache.clear()
+            advance = metrics.horizontalAdvance(text)
+            self._advance_cache[key] = advance
+        return advance
+
+    def _static_text(self, text: str, font: QFont, font_key: str, italic: bool) -> QStaticText:
+        """Подготовленный QStaticText с кешированной раскладкой глифов (LRU)."""
+        key = (font_key, italic, text)
+        static = self._static_cache.get(key)
+        if static is not None:
+            self._static_cache.move_to_end(key)
+            return static
+
+        static = QStaticText(text)
+        static.setTextFormat(Qt.TextFormat.PlainText)
+        static.prepare(QTransform(), font)
+        self._static_cache[key] = static
+        if len(self._static_cache) > _STATIC_TEXT_CACHE_SIZE:
+            self._static_cache.popitem(last=False)
+        return static
+
+    @staticmethod
+    def _draw_static_text(painter: QPainter, rect: QRect, alignment, static: QStaticText) -> None:
+        """Отрисовка QStaticText в прямоугольнике с учетом вертикального выравнивания."""
+        height = static.size().height()
+        y = float(rect.top())
+        if alignment & Qt.AlignmentFlag.AlignVCenter:
+            y += (rect.height() - height) / 2
+        elif alignment & Qt.AlignmentFlag.AlignBottom:
+            y = rect.bottom() + 1 - height
+
+        painter.setClipRect(rect)
+        painter.drawStaticText(QPointF(rect.left(), y), static)
 
     def paint(self, painter, option, index):
         is_single_line = index.data(SINGLE_LINE_ITEM_ROLE)
@@ -53,40 +123,53 @@ class ChapterItemDelegate(QStyledItemDelegate):
             style.drawControl(QStyle.ControlElement.CE_ItemViewItem, options, painter)
 
         default_color = options.palette.color(QPalette.ColorRole.Text)
-        team_color_hex = self.team_colors.get(team_name)
-        team_qcolor = QColor(team_color_hex) if team_color_hex else default_color
+        team_qcolor = self.team_colors.get(team_name) or default_color
 
         if painter:
             painter.save()
             original_font = options.font
 
             if is_single_line:
-                match = re.match(r"(.*) (\[.*\])", text) if text else None
-                if match:
-                    part1, part2 = match.groups()
-
-                    font = QFont(original_font)
-                    font.setItalic(False)
-                    painter.setFont(font)
+                part1 = index.data(PART1_ROLE)
+                part2 = index.data(PART2_ROLE)
+                if part1 is None:
+                    match = _TITLE_RE.match(text) if text else None
+                    if match:
+                        part1, part2 = match.groups()
+
+                if part1 is not None:
+                    font_key = self._font_key(original_font)
+                    regular_font = self._font_variant(original_font, font_key, False)
+                    painter.setFont(regular_font)
                     painter.setPen(default_color)
-                    painter.drawText(text_rect, options.displayAlignment, part1)
-
-                    part1_width = painter.fontMetrics().horizontalAdvance(part1)
-                    text_rect.setLeft(text_rect.left() + part1_width)
-                    font.setItalic(True)
-                    painter.setFont(font)
+                    self._draw_static_text(
+                        painter, text_rect, options.displayAlignment,
+                        self._static_text(part1, regular_font, font_key, False),
+                    )
+
+                    part1_width = self._text_advance(painter.fontMetrics(), font_key, part1)
+                    italic_font = self._font_variant(original_font, font_key, True)
+                    painter.setFont(italic_font)
+                    separator_width = self._text_advance(painter.fontMetrics(), font_key, _TEAM_SEPARATOR, True)
+                    text_rect.setLeft(text_rect.left() + part1_width + separator_width)
                     painter.setPen(team_qcolor)
-                    painter.drawText(text_rect, options.displayAlignment, "    " + part2)
+                    self._draw_static_text(
+                        painter, text_rect, options.displayAlignment,
+                        self._static_text(part2, italic_font, font_key, True),
+                    )
                 else:
                     painter.setFont(original_font)
                     painter.setPen(default_color)
                     painter.drawText(text_rect, options.displayAlignment, text)
 
             elif team_name:
-                font = QFont(original_font)
-                font.setItalic(True)
-                painter.setFont(font)
+                font_key = self._font_key(original_font)
+                italic_font = self._font_variant(original_font, font_key, True)
+                painter.setFont(italic_font)
                 painter.setPen(team_qcolor)
-                painter.drawText(text_rect, options.displayAlignment, text)
+                self._draw_static_text(
+                    painter, text_rect, options.displayAlignment,
+                    self._static_text(text, italic_font, font_key, True),
+                )
 
             painter.restore() 
\ No newline at end of file
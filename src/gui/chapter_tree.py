@@ -2,21 +2,324 @@
 Виджет дерева глав для отображения и выбора глав новеллы
 """
 
-from typing import Any, Dict, List, Optional
+import sys
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from PyQt6.QtCore import QTimer, Qt, QVariant, pyqtSignal
-from PyQt6.QtGui import QIcon, QPixmap
-from PyQt6.QtWidgets import QMenu, QTreeWidgetItem, QTreeWidgetItemIterator, QTreeWidget
+from PyQt6.QtCore import QAbstractItemModel, QModelIndex, QTimer, Qt, pyqtSignal
+from PyQt6.QtGui import QFont, QIcon, QPixmap
+from PyQt6.QtWidgets import QMenu, QTreeView
 import base64
 
 from ..api import RanobeLibAPI
+from ..branches import volume_sort_key
 from ..img import ImageHandler
 from ..parser import RanobeLibParser
-from .chapter_delegate import TEAM_NAME_ROLE, SINGLE_LINE_ITEM_ROLE, ChapterItemDelegate
+from .chapter_delegate import PART1_ROLE, PART2_ROLE, TEAM_NAME_ROLE, SINGLE_LINE_ITEM_ROLE, ChapterItemDelegate
 from .preview_dialog import PreviewDialog
 
+KEY_ROLE = Qt.ItemDataRole.UserRole + 10
+
+_CHECK_ROLES = [Qt.ItemDataRole.CheckStateRole]
+_CACHED_TOOLTIP = "Сохранено в кэш"
+
+
+class _ChapterNode:
+    """Узел дерева глав: том, глава или перевод главы."""
+
+    __slots__ = (
+        "parent",
+        "row",
+        "children",
+        "text",
+        "check_state",
+        "chapter",
+        "branch_id",
+        "key",
+        "team_name",
+        "part1",
+        "part2",
+        "is_volume",
+        "cached",
+    )
+
+    def __init__(self, text: str, parent: Optional["_ChapterNode"] = None):
+        self.parent = parent
+        self.row = 0
+        self.children: List["_ChapterNode"] = []
+        self.text = text
+        self.check_state = Qt.CheckState.Checked
+        self.chapter: Optional[Dict[str, Any]] = None
+        self.branch_id: Optional[str] = None
+        self.key: Optional[Tuple[str, str, str]] = None
+        self.team_name: Optional[str] = None
+        self.part1: Optional[str] = None
+        self.part2: Optional[str] = None
+        self.is_volume = False
+        self.cached = False
+        if parent is not None:
+            self.row = len(parent.children)
+            parent.children.append(self)
+
+
+class ChapterTreeModel(QAbstractItemModel):
+    """Модель дерева глав: тома, главы и переводы хранятся в легких узлах."""
+
+    def __init__(self, cache_icon: QIcon, parent=None):
+        super().__init__(parent)
+        self._root = _ChapterNode("")
+        self._leaves: List[_ChapterNode] = []
+        self._checked_count = 0
+        self.cache_icon = cache_icon
+        self._volume_font = QFont()
+        self._volume_font.setBold(True)
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        parent_node = parent.internalPointer() if parent.isValid() else self._root
+        if column != 0 or not 0 <= row < len(parent_node.children):
+            return QModelIndex()
+        return self.createIndex(row, 0, parent_node.children[row])
+
+    def parent(self, index: QModelIndex) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+        node = index.internalPointer().parent
+        if node is None or node is self._root:
+            return QModelIndex()
+        return self.createIndex(node.row, 0, node)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        node = parent.internalPointer() if parent.isValid() else self._root
+        return len(node.children)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 1
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsUserCheckable
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        node: _ChapterNode = index.internalPointer()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return node.text
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return node.check_state.value
+        if role == SINGLE_LINE_ITEM_ROLE:
+            return True if node.part1 is not None else None
+        if role == TEAM_NAME_ROLE:
+            return node.team_name
+        if role == PART1_ROLE:
+            return node.part1
+        if role == PART2_ROLE:
+            return node.part2
+        if role == Qt.ItemDataRole.UserRole:
+            return node.chapter
+        if role == KEY_ROLE:
+            return node.key
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self.cache_icon if node.cached else None
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return _CACHED_TOOLTIP if node.cached else None
+        if role == Qt.ItemDataRole.FontRole:
+            return self._volume_font if node.is_volume else None
+        return None
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if role != Qt.ItemDataRole.CheckStateRole or not index.isValid():
+            return False
+        self.set_node_state(index.internalPointer(), Qt.CheckState(value))
+        return True
+
+    def volumes(self) -> List[_ChapterNode]:
+        """Узлы томов верхнего уровня."""
+        return self._root.children
+
+    def leaves(self) -> List[_ChapterNode]:
+        """Узлы-переводы (с идентификатором ветки) в порядке дерева."""
+        return self._leaves
+
+    def checked_count(self) -> int:
+        """Количество выбранных узлов-переводов."""
+        return self._checked_count
+
+    def clear(self) -> None:
+        """Очистка модели."""
+        self.beginResetModel()
+        self._root = _ChapterNode("")
+        self._leaves = []
+        self._checked_count = 0
+        self.endResetModel()
+
+    def set_volumes(
+        self,
+        volumes_data: Dict[str, List[tuple]],
+        chapters_state: Dict[tuple, Qt.CheckState],
+        cached_chapters: Set[Tuple[str, str, str]],
+    ) -> None:
+        """Перестроение узлов дерева по данным о томах и главах."""
+        root, leaves = self._build_root(volumes_data, chapters_state, cached_chapters)
+
+        self.beginResetModel()
+        self._root = root
+        self._leaves = leaves
+        self._checked_count = sum(1 for leaf in leaves if leaf.check_state == Qt.CheckState.Checked)
+        self.endResetModel()
+
+    def _build_root(
+        self,
+        volumes_data: Dict[str, List[tuple]],
+        chapters_state: Dict[tuple, Qt.CheckState],
+        cached_chapters: Set[Tuple[str, str, str]],
+    ) -> Tuple[_ChapterNode, List[_ChapterNode]]:
+        """Построение отсоединенного от модели дерева узлов и списка узлов-переводов."""
+        root = _ChapterNode("")
+        leaves: List[_ChapterNode] = []
+        add_leaf = leaves.append
+        intern = sys.intern
+        state_get = chapters_state.get
+        checked = Qt.CheckState.Checked
+
+        for vol_num in sorted(volumes_data, key=volume_sort_key):
+            vol_name = f"Том {vol_num}" if vol_num != "0" else "Том не указан"
+            vol_node = _ChapterNode(vol_name, root)
+            vol_node.is_volume = True
+
+            for chapter, translations in volumes_data[vol_num]:
+                volume = intern(str(chapter.get("volume", "0")))
+                number = intern(str(chapter.get("number", "0")))
+
+                ch_name = chapter.get("name", "").strip()
+                ch_number = chapter.get("number", "?")
+
+                chapter_title = f"Глава {ch_number} - {ch_name}" if ch_name else f"Глава {ch_number}"
+
+                single = len(translations) == 1
+                if not single:
+                    group_node = _ChapterNode(chapter_title, vol_node)
+
+                for trans_info in translations:
+                    branch_id = trans_info["id"]
+                    branch_key = intern(str(branch_id))
+                    teams = trans_info["teams"]
+                    if len(teams) == 1:
+                        translator_name = teams[0]
+                    else:
+                        translator_name = ", ".join(teams) if teams else "Неизвестный"
+                    team_label = f"[{translator_name}]"
+
+                    if single:
+                        node = _ChapterNode(f"{chapter_title} {team_label}", vol_node)
+                        node.part1 = chapter_title
+                        node.part2 = team_label
+                    else:
+                        node = _ChapterNode(team_label, group_node)
+
+                    node.chapter = chapter
+                    node.branch_id = branch_id
+                    node.key = key = (volume, number, branch_key)
+                    node.team_name = teams[0] if teams else translator_name
+                    node.check_state = state_get(key, checked)
+                    node.cached = (branch_key, volume, number) in cached_chapters
+                    add_leaf(node)
+
+                if not single:
+                    group_node.check_state = self._aggregate_state(group_node.children)
+
+            vol_node.check_state = self._aggregate_state(vol_node.children)
+
+        return root, leaves
+
+    @staticmethod
+    def _aggregate_state(children: List[_ChapterNode]) -> Qt.CheckState:
+        """Состояние родителя по состояниям дочерних узлов."""
+        states = {child.check_state for child in children}
+        if len(states) == 1:
+            return states.pop()
+        return Qt.CheckState.PartiallyChecked if states else Qt.CheckState.Unchecked
+
+    def _index_for(self, node: _ChapterNode) -> QModelIndex:
+        """Индекс узла, если он принадлежит текущему дереву."""
+        ancestor = node
+        while ancestor.parent is not None and ancestor.parent is not self._root:
+            ancestor = ancestor.parent
+        volumes = self._root.children
+        if ancestor.row >= len(volumes) or volumes[ancestor.row] is not ancestor:
+            return QModelIndex()
+        return self.createIndex(node.row, 0, node)
+
+    def set_node_state(self, node: _ChapterNode, state: Qt.CheckState) -> None:
+        """Установка состояния узла с распространением на потомков и предков."""
+        self._apply_state(node, state)
+        index = self._index_for(node)
+        if not index.isValid():
+            return
+        self.dataChanged.emit(index, index, _CHECK_ROLES)
+
+        parent = node.parent
+        while parent is not None and parent is not self._root:
+            parent_state = self._aggregate_state(parent.children)
+            if parent_state == parent.check_state:
+                break
+            parent.check_state = parent_state
+            parent_index = self.createIndex(parent.row, 0, parent)
+            self.dataChanged.emit(parent_index, parent_index, _CHECK_ROLES)
+            parent = parent.parent
+
+    def _apply_state(self, node: _ChapterNode, state: Qt.CheckState) -> None:
+        """Установка состояния узлу и всем его потомкам."""
+        if node.branch_id is not None:
+            checked = Qt.CheckState.Checked
+            self._checked_count += (state == checked) - (node.check_state == checked)
+        node.check_state = state
+        children = node.children
+        if not children:
+            return
+        for child in children:
+            self._apply_state(child, state)
+        self._emit_children_changed(node)
+
+    def _emit_children_changed(self, node: _ChapterNode) -> None:
+        """Одно уведомление об изменении состояния для всего диапазона дочерних узлов."""
+        children = node.children
+        if children:
+            self.dataChanged.emit(
+                self.createIndex(0, 0, children[0]), self.createIndex(len(children) - 1, 0, children[-1]), _CHECK_ROLES
+            )
 
-class ChapterTree(QTreeWidget):
+    def set_checked_leaves(self, checked_leaves: List[_ChapterNode]) -> None:
+        """Пакетный выбор: отмечаются только переданные узлы-переводы, остальные снимаются."""
+        checked = Qt.CheckState.Checked
+        unchecked = Qt.CheckState.Unchecked
+        for leaf in self._leaves:
+            leaf.check_state = unchecked
+        for leaf in checked_leaves:
+            leaf.check_state = checked
+        self._checked_count = sum(1 for leaf in self._leaves if leaf.check_state == checked)
+
+        for vol_node in self._root.children:
+            for ch_node in vol_node.children:
+                if ch_node.children:
+                    ch_node.check_state = self._aggregate_state(ch_node.children)
+                    self._emit_children_changed(ch_node)
+            vol_node.check_state = self._aggregate_state(vol_node.children)
+            self._emit_children_changed(vol_node)
+        self._emit_children_changed(self._root)
+
+    def mark_cached(self, node: _ChapterNode) -> None:
+        """Отметка перевода как сохраненного в кэш."""
+        node.cached = True
+        index = self._index_for(node)
+        if index.isValid():
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole, Qt.ItemDataRole.ToolTipRole])
+
+
+class ChapterTree(QTreeView):
     """Виджет дерева глав для отображения и выбора глав новеллы"""
 
     stats_changed = pyqtSignal(int, int)
@@ -27,38 +330,42 @@ class ChapterTree(QTreeWidget):
         self._stats_update_timer = QTimer(self)
         self._stats_update_timer.setSingleShot(True)
         self._stats_update_timer.timeout.connect(self._update_stats)
-        
+
         self.api: Optional[RanobeLibAPI] = None
         self.parser: Optional[RanobeLibParser] = None
         self.image_handler: Optional[ImageHandler] = None
         self.novel_info: Optional[Dict[str, Any]] = None
-        
+
         self._setup_ui()
 
     def _setup_ui(self):
         """Настройка интерфейса виджета"""
         self.setHeaderHidden(True)
         self.setAlternatingRowColors(True)
-        self.setSelectionMode(QTreeWidget.SelectionMode.ExtendedSelection)
-        self.itemChanged.connect(self._update_stats_on_change)
+        self.setUniformRowHeights(True)
+        self.setSelectionMode(QTreeView.SelectionMode.ExtendedSelection)
 
         self.delegate = ChapterItemDelegate(self)
         self.setItemDelegate(self.delegate)
 
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self._show_context_menu)
-        
-        self.itemDoubleClicked.connect(self._on_item_double_clicked)
-        
+
+        self.doubleClicked.connect(self._on_item_double_clicked)
+
         cache_icon_b64 = "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAAsTAAALEwEAmpwYAAACc0lEQVR4nO1WOYgUURBtL0RXVDQZRMU1F1FEUVcQ3dQLj2SFZVFQgw00EWST2XRVzMw8EMxExUAzNfTKPAcWoe223vvdzKDgEahfiqmFoZnZ6Z6dFYR5UMHU+eb/6qofBD308D/Cez+HZInkRpOS6ma9MOvFrgKISfpGMZ3aNnS9cLVaXQbgJoDfAH4BeEJynOQZk3EAT82mPtfTNF3aleIA1pN8C+APgGtRFK1p5RvH8VoAN9SX5BsR6Z9R8TAMVwCokPxG8kjeOOfcMY0B8KFWqy3vmADJ+3ak+1vYh1Wa2QActNg7HRUXkd3WYJda+QB4qTLNH7iiOZxzuwoTIPkAwBe9hk4JRFG0EsBXPcmixZeQ/EHy1nR+7QhYrtskv4tIXxECA3b8w20IvMhBYMRy7chNwDl31IbL3kzBIe/9/AyBV1O/1QbgeCZm0Ajk/ooCTWJBA1M6EdlnuruVSmVhloDqSN5TH/XNnmaWWDsCg1nWOusBTFiyh2EYLiL5XAnEcbwYwCOzTTTuBZsJSmpPbgJpmq62aXYxayNZNnKPddoBeK9j2HTlJv6XNVeSJKtyE1Boc5Gc9N7PCzIgeT67jFSX9dNYkh/1pIKiYH3JaOKRFvZR2w96UqPNfETkhF3LqcIEvPcLbA84EVnXzAfASZUWxftJJgDeNX45hSAiW20gvda+yBunG1P7QwdQkiRbgpnA1WfCTwCfARxo5w/gEADRGJKHg26A5E4AkfXEMwBnnXOb7FlWcs5tBnBOm83u/BOA7UE3ISJ9AMaaPccan2UALuhcCGYL3vu5IrINwGmbCWXtcu2Xf/Iw7aGHoMv4C3o9+FwPrwvXAAAAAElFTkSuQmCC"
         pixmap = QPixmap()
         pixmap.loadFromData(base64.b64decode(cache_icon_b64))
         self.cache_icon = QIcon(pixmap)
 
+        self._model = ChapterTreeModel(self.cache_icon, self)
+        self.setModel(self._model)
+        self._model.dataChanged.connect(self._update_stats_on_change)
+
     def set_api_components(
-        self, 
-        api: RanobeLibAPI, 
-        parser: RanobeLibParser, 
+        self,
+        api: RanobeLibAPI,
+        parser: RanobeLibParser,
         image_handler: ImageHandler,
         novel_info: Dict[str, Any]
     ):
@@ -72,13 +379,16 @@ class ChapterTree(QTreeWidget):
         """Установка словаря цветов для команд."""
         self.delegate.set_team_colors(colors)
 
+    def clear(self):
+        """Очистка дерева глав."""
+        self._model.clear()
+
     def update_chapters_tree(
         self, volumes_data: Dict[str, List[tuple]], chapters_state: Dict[tuple, Qt.CheckState]
     ):
         """Обновление дерева глав на основе данных о томах и главах"""
         self.chapters_state = chapters_state.copy() if chapters_state else {}
-        self.clear()
-        
+
         cached_chapters = set()
         if self.novel_info:
             try:
@@ -87,294 +397,88 @@ class ChapterTree(QTreeWidget):
             except Exception:
                 pass
 
-        for vol_num in sorted(volumes_data.keys(), key=lambda x: int(x) if x.isdigit() else 0):
-            vol_name = f"Том {vol_num}" if vol_num != "0" else "Том не указан"
-            vol_item = QTreeWidgetItem([vol_name])
-
-            font = vol_item.font(0)
-            font.setBold(True)
-            vol_item.setFont(0, font)
-
-            vol_item.setFlags(
-                vol_item.flags() | Qt.ItemFlag.ItemIsAutoTristate | Qt.ItemFlag.ItemIsUserCheckable
-            )
-            vol_item.setCheckState(0, Qt.CheckState.Checked)
-            self.addTopLevelItem(vol_item)
-
-            for chapter_info in volumes_data[vol_num]:
-                chapter, translations = chapter_info
-
-                ch_name = chapter.get("name", "").strip()
-                ch_number = chapter.get("number", "?")
-
-                chapter_title = f"Глава {ch_number} - {ch_name}" if ch_name else f"Глава {ch_number}"
-
-                if len(translations) == 1:
-                    trans_info = translations[0]
-                    branch_id = trans_info["id"]
-                    teams = trans_info["teams"]
-                    translator_name = ", ".join(teams) if teams else "Неизвестный"
-                    coloring_team_name = teams[0] if teams else translator_name
-
-                    full_title = f"{chapter_title} [{translator_name}]"
-
-                    ch_item = QTreeWidgetItem([full_title])
-                    ch_item.setData(0, SINGLE_LINE_ITEM_ROLE, True)
-                    ch_item.setData(0, TEAM_NAME_ROLE, coloring_team_name)
-                    ch_item.setFlags(ch_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-
-                    key = (
-                        str(chapter.get("volume", "0")),
-                        str(chapter.get("number", "0")),
-                        str(branch_id),
-                    )
-                    check_state = self.chapters_state.get(key, Qt.CheckState.Checked)
-                    ch_item.setCheckState(0, check_state)
-
-                    ch_item.setData(0, Qt.ItemDataRole.UserRole, QVariant(chapter))
-                    ch_item.setData(1, Qt.ItemDataRole.UserRole, QVariant(branch_id))
-
-                    if (str(branch_id), str(chapter.get("volume", "0")), str(chapter.get("number", "0"))) in cached_chapters:
-                        ch_item.setIcon(0, self.cache_icon)
-                        ch_item.setToolTip(0, "Сохранено в кэш")
-
-                    vol_item.addChild(ch_item)
-                else:
-                    ch_item = QTreeWidgetItem([chapter_title])
-                    ch_item.setFlags(
-                        ch_item.flags() | Qt.ItemFlag.ItemIsAutoTristate | Qt.ItemFlag.ItemIsUserCheckable
-                    )
-                    ch_item.setCheckState(0, Qt.CheckState.Checked)
-                    vol_item.addChild(ch_item)
-
-                    for trans_info in translations:
-                        branch_id = trans_info["id"]
-                        teams = trans_info["teams"]
-
-                        translator_name = ", ".join(teams) if teams else "Неизвестный"
-                        coloring_team_name = teams[0] if teams else translator_name
-                        display_name = f"[{translator_name}]"
-
-                        translation_item = QTreeWidgetItem([display_name])
-                        translation_item.setData(0, TEAM_NAME_ROLE, coloring_team_name)
-
-                        translation_item.setFlags(translation_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-
-                        key = (
-                            str(chapter.get("volume", "0")),
-                            str(chapter.get("number", "0")),
-                            str(branch_id),
-                        )
-                        check_state = self.chapters_state.get(key, Qt.CheckState.Checked)
-                        translation_item.setCheckState(0, check_state)
-
-                        translation_item.setData(0, Qt.ItemDataRole.UserRole, QVariant(chapter))
-                        translation_item.setData(1, Qt.ItemDataRole.UserRole, QVariant(branch_id))
-                        
-                        if (str(branch_id), str(chapter.get("volume", "0")), str(chapter.get("number", "0"))) in cached_chapters:
-                            translation_item.setIcon(0, self.cache_icon)
-                            translation_item.setToolTip(0, "Сохранено в кэш")
-
-                        ch_item.addChild(translation_item)
-
-        self.expandAll()
+        self.setUpdatesEnabled(False)
+        try:
+            self._model.set_volumes(volumes_data, self.chapters_state, cached_chapters)
+            self.expandAll()
+        finally:
+            self.setUpdatesEnabled(True)
         self._update_stats()
 
     def save_chapters_state(self):
         """Сохраняет текущее состояние (выбрано/не выбрано) всех глав-переводов."""
-        self.chapters_state.clear()
-
-        iterator = QTreeWidgetItemIterator(self)
-        while iterator.value():
-            item = iterator.value()
-            if item:
-                chapter_data = item.data(0, Qt.ItemDataRole.UserRole)
-                branch_id = item.data(1, Qt.ItemDataRole.UserRole)
-
-                if chapter_data and branch_id is not None:
-                    key = (
-                        str(chapter_data.get("volume", "0")),
-                        str(chapter_data.get("number", "0")),
-                        str(branch_id),
-                    )
-                    self.chapters_state[key] = item.checkState(0)
-            iterator += 1
-
+        self.chapters_state = {leaf.key: leaf.check_state for leaf in self._model.leaves()}
         return self.chapters_state
 
     def get_selected_chapters(self) -> List[Dict[str, Any]]:
         """Возвращает список выбранных для скачивания глав-переводов"""
-        selected_chapters = []
-
-        for i in range(self.topLevelItemCount()):
-            vol_item = self.topLevelItem(i)
-            if vol_item is None:
-                continue
-
-            for j in range(vol_item.childCount()):
-                ch_item = vol_item.child(j)
-                if ch_item is None:
-                    continue
-
-                if ch_item.childCount() == 0:
-                    if ch_item.checkState(0) == Qt.CheckState.Checked:
-                        chapter_data = ch_item.data(0, Qt.ItemDataRole.UserRole)
-                        branch_id = ch_item.data(1, Qt.ItemDataRole.UserRole)
-                        if chapter_data and branch_id is not None:
-                            if ch_item.data(0, TEAM_NAME_ROLE) is not None:
-                                selected_chapters.append(
-                                    {"chapter": chapter_data, "branch_ids": [branch_id]}
-                                )
-                else:
-                    for k in range(ch_item.childCount()):
-                        translation_item = ch_item.child(k)
-                        if translation_item is None:
-                            continue
-
-                        if translation_item.checkState(0) == Qt.CheckState.Checked:
-                            chapter_data = translation_item.data(0, Qt.ItemDataRole.UserRole)
-                            branch_id = translation_item.data(1, Qt.ItemDataRole.UserRole)
-
-                            if chapter_data and branch_id is not None:
-                                selected_chapters.append(
-                                    {"chapter": chapter_data, "branch_ids": [branch_id]}
-                                )
-
-        return selected_chapters
+        return [
+            {"chapter": leaf.chapter, "branch_ids": [leaf.branch_id]}
+            for leaf in self._model.leaves()
+            if leaf.check_state == Qt.CheckState.Checked
+        ]
 
     def set_check_state_for_all_items(self, state: Qt.CheckState):
         """Устанавливает состояние чекбокса для всех элементов в дереве"""
-        self.itemChanged.disconnect(self._update_stats_on_change)
+        self._model.dataChanged.disconnect(self._update_stats_on_change)
 
-        iterator = QTreeWidgetItemIterator(self)
-        while iterator.value():
-            item = iterator.value()
-            if item:
-                item.setCheckState(0, state)
-            iterator += 1
+        for vol_node in self._model.volumes():
+            self._model.set_node_state(vol_node, state)
 
-        self.itemChanged.connect(self._update_stats_on_change)
+        self._model.dataChanged.connect(self._update_stats_on_change)
         self._update_stats()
 
     def select_default_chapters(self):
         """Выбирает по одному переводу для каждой главы по умолчанию."""
         try:
-            self.itemChanged.disconnect(self._update_stats_on_change)
+            self._model.dataChanged.disconnect(self._update_stats_on_change)
         except TypeError:
             pass
 
-        iterator = QTreeWidgetItemIterator(self)
-        while iterator.value():
-            item = iterator.value()
-            if item:
-                item.setCheckState(0, Qt.CheckState.Unchecked)
-            iterator += 1
-
-        selected_chapter_keys = set()
-
-        while True:
-            first_unselected_item = None
-
-            iterator = QTreeWidgetItemIterator(self)
-            while iterator.value():
-                item = iterator.value()
-                if item:
-                    chapter_data = item.data(0, Qt.ItemDataRole.UserRole)
-                    branch_id = item.data(1, Qt.ItemDataRole.UserRole)
-
-                    if chapter_data and branch_id is not None:
-                        key = (
-                            str(chapter_data.get("volume", "0")),
-                            str(chapter_data.get("number", "0")),
-                        )
-                        if key not in selected_chapter_keys:
-                            first_unselected_item = item
-                            break
-                iterator += 1
-
-            if not first_unselected_item:
-                break
-
-            first_unselected_item.setCheckState(0, Qt.CheckState.Checked)
-            chapter_data = first_unselected_item.data(0, Qt.ItemDataRole.UserRole)
-            selected_branch_id = first_unselected_item.data(1, Qt.ItemDataRole.UserRole)
-
-            if chapter_data:
-                key = (str(chapter_data.get("volume", "0")), str(chapter_data.get("number", "0")))
-                selected_chapter_keys.add(key)
+        branches_by_key: Dict[Tuple[str, str], Dict[Any, _ChapterNode]] = {}
+        for leaf in self._model.leaves():
+            branches_by_key.setdefault(leaf.key[:2], {}).setdefault(leaf.branch_id, leaf)
 
-            while iterator.value():
-                item = iterator.value()
-                if item:
-                    chapter_data_next = item.data(0, Qt.ItemDataRole.UserRole)
-                    branch_id_next = item.data(1, Qt.ItemDataRole.UserRole)
+        branch_rank: Dict[Any, int] = {}
+        default_leaves: List[_ChapterNode] = []
+        for branch_leaves in branches_by_key.values():
+            ranked = [(branch_rank[branch_id], branch_id) for branch_id in branch_leaves if branch_id in branch_rank]
+            if ranked:
+                branch_id = min(ranked)[1]
+            else:
+                branch_id = next(iter(branch_leaves))
+                branch_rank[branch_id] = len(branch_rank)
+            default_leaves.append(branch_leaves[branch_id])
 
-                    if chapter_data_next and branch_id_next is not None:
-                        key_next = (
-                            str(chapter_data_next.get("volume", "0")),
-                            str(chapter_data_next.get("number", "0")),
-                        )
+        self._model.set_checked_leaves(default_leaves)
 
-                        if key_next not in selected_chapter_keys and branch_id_next == selected_branch_id:
-                            item.setCheckState(0, Qt.CheckState.Checked)
-                            selected_chapter_keys.add(key_next)
-                iterator += 1
-
-        self.itemChanged.connect(self._update_stats_on_change)
+        self._model.dataChanged.connect(self._update_stats_on_change)
         self._update_stats()
 
-    def _update_stats_on_change(self, item, column):
+    def _update_stats_on_change(self, top_left, bottom_right, roles=()):
         """Обновляет статистику при изменении состояния элемента"""
-        if column == 0:
-            self._stats_update_timer.start(50)
+        if not roles or Qt.ItemDataRole.CheckStateRole in roles:
+            self._stats_update_timer.start(0)
 
     def _update_stats(self):
         """Обновляет статистику выбранных глав"""
-        total_translations = 0
-        selected_translations = 0
-
-        for i in range(self.topLevelItemCount()):
-            vol_item = self.topLevelItem(i)
-            if vol_item is None:
-                continue
-
-            for j in range(vol_item.childCount()):
-                ch_item = vol_item.child(j)
-                if ch_item is None:
-                    continue
-
-                if ch_item.childCount() == 0:
-                    if ch_item.data(0, TEAM_NAME_ROLE) is not None:
-                        total_translations += 1
-                        if ch_item.checkState(0) == Qt.CheckState.Checked:
-                            selected_translations += 1
-                else:
-                    for k in range(ch_item.childCount()):
-                        translation_item = ch_item.child(k)
-                        if translation_item is None:
-                            continue
-
-                        total_translations += 1
-
-                        if translation_item.checkState(0) == Qt.CheckState.Checked:
-                            selected_translations += 1
-
-        self.stats_changed.emit(total_translations, selected_translations)
+        self.stats_changed.emit(len(self._model.leaves()), self._model.checked_count())
 
         if viewport := self.viewport():
             viewport.update()
 
-    def _on_item_double_clicked(self, item: QTreeWidgetItem, column: int):
+    def _on_item_double_clicked(self, index):
         """Обработка двойного клика по элементу"""
         if not self.api or not self.parser or not self.image_handler or not self.novel_info:
             return
-        
-        chapter_data = item.data(0, Qt.ItemDataRole.UserRole)
-        branch_id = item.data(1, Qt.ItemDataRole.UserRole)
-        
-        if not chapter_data or branch_id is None:
+
+        node = index.internalPointer() if index.isValid() else None
+        if node is None or not node.chapter or node.branch_id is None:
             return
-        
+
+        chapter_data = node.chapter
+        branch_id = node.branch_id
+
         try:
             preview_dialog = PreviewDialog(
                 novel_info=self.novel_info,
@@ -385,12 +489,11 @@ class ChapterTree(QTreeWidget):
                 image_handler=self.image_handler,
                 parent=self.window()
             )
-            
+
             def on_chapter_cached(n_id, b_id, vol, num):
                 if str(b_id) == str(branch_id) and str(vol) == str(chapter_data.get("volume", "0")) and str(num) == str(chapter_data.get("number", "0")):
-                    item.setIcon(0, self.cache_icon)
-                    item.setToolTip(0, "Сохранено в кэш")
-                    
+                    self._model.mark_cached(node)
+
             preview_dialog.chapter_cached.connect(on_chapter_cached)
             preview_dialog.show()
         except Exception as e:
@@ -142,10 +142,8 @@ class DownloadWorker(QThread):
         non_cached_chapters_done = 0
         total_download_time = 0.0
 
-        for i, chapter_data in enumerate(self.selected_chapters):
-            if self.is_cancelled:
-                return
-
+        chapters_to_process: List[Dict[str, Any]] = []
+        for chapter_data in self.selected_chapters:
             chapter_info = chapter_data["chapter"]
             branch_ids = chapter_data["branch_ids"]
             branch_id = branch_ids[0] if branch_ids else "0"
@@ -157,46 +155,55 @@ class DownloadWorker(QThread):
                 ),
                 {"branch_id": branch_id},
             )
+            chapters_to_process.append({"chapter": chapter_info, "branch": branch_info})
 
-            self.chapter_download.emit(i + 1, total_chapters)
-            chapter_title = f"Глава {chapter_info.get('number', '?')}"
-            if chapter_info.get("name"):
-                chapter_title += f" - {chapter_info.get('name')}"
+        processed_iter = processor.chapter_loader.iter_processed_chapters(
+            chapters_to_process, self.novel_info, self._temp_dir
+        )
 
-            self.progress_update.emit(
-                f"Загрузка {chapter_title}...", int(100 * (i / total_chapters))
-            )
+        try:
+            for i, ch_data in enumerate(chapters_to_process):
+                if self.is_cancelled:
+                    return
 
-            start_chapter_time = time.time()
+                chapter_info = ch_data["chapter"]
+                self.chapter_download.emit(i + 1, total_chapters)
+                chapter_title = f"Глава {chapter_info.get('number', '?')}"
+                if chapter_info.get("name"):
+                    chapter_title += f" - {chapter_info.get('name')}"
 
-            prepared_chapter = processor.chapter_loader._process_single_chapter(
-                {"chapter": chapter_info, "branch": branch_info},
-                self.novel_info,
-                self._temp_dir,
-            )
-            
-            chapter_time = time.time() - start_chapter_time
+                self.progress_update.emit(
+                    f"Загрузка {chapter_title}...", int(100 * (i / total_chapters))
+                )
 
-            self.prepared_chapters.append(prepared_chapter)
+                start_chapter_time = time.time()
 
-            if not prepared_chapter.get("is_cached", False):
-                non_cached_chapters_done += 1
-                total_download_time += chapter_time
+                prepared_chapter = next(processed_iter)
+                
+                chapter_time = time.time() - start_chapter_time
 
-            elapsed_time = time.time() - self.start_time
-            chapters_done = i + 1
-            remaining_time = -1.0
+                self.prepared_chapters.append(prepared_chapter)
+
+                if not prepared_chapter.get("is_cached", False):
+                    non_cached_chapters_done += 1
+                    total_download_time += chapter_time
+
+                elapsed_time = time.time() - self.start_time
+                chapters_done = i + 1
+                remaining_time = -1.0
             
-            chapters_remaining = total_chapters - chapters_done
+                chapters_remaining = total_chapters - chapters_done
             
-            if non_cached_chapters_done > 0:
-                avg_time_per_chapter = total_download_time / non_cached_chapters_done
-                remaining_time = avg_time_per_chapter * chapters_remaining
-            elif chapters_done > 0:
-                avg_time_per_chapter = elapsed_time / chapters_done
-                remaining_time = avg_time_per_chapter * chapters_remaining
-
-            self.time_update.emit(elapsed_time, remaining_time)
+                if non_cached_chapters_done > 0:
+                    avg_time_per_chapter = total_download_time / non_cached_chapters_done
+                    remaining_time = avg_time_per_chapter * chapters_remaining
+                elif chapters_done > 0:
+                    avg_time_per_chapter = elapsed_time / chapters_done
+                    remaining_time = avg_time_per_chapter * chapters_remaining
+
+                self.time_update.emit(elapsed_time, remaining_time)
+        finally:
+            processed_iter.close()
 
         self.progress_update.emit("Все главы загружены", 100)
 
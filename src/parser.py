@@ -5,11 +5,24 @@
 import html as html_lib
 import json
 import re
+from functools import lru_cache
 from typing import Any, Callable, Dict, List
 
 from .api import RanobeLibAPI
 
 
+@lru_cache(maxsize=4096)
+def _decode_html_entities(text: str, max_iterations: int) -> str:
+    """Многократное раскрытие HTML-сущностей с кешированием по строке."""
+    previous = text
+    for _ in range(max_iterations):
+        decoded = html_lib.unescape(previous)
+        if decoded == previous:
+            break
+        previous = decoded
+    return previous
+
+
 class RanobeLibParser:
     """Класс для парсинга контента с RanobeLIB"""
 
@@ -74,14 +87,9 @@ class RanobeLibParser:
         """Рекурсивное декодирование HTML-сущностей."""
         if not isinstance(text, str):
             return text  # type: ignore
-
-        previous = text
-        for _ in range(max_iterations):
-            decoded = html_lib.unescape(previous)
-            if decoded == previous:
-                break
-            previous = decoded
-        return previous
+        if "&" not in text:
+            return text
+        return _decode_html_entities(text, max_iterations)
 
     def _handle_simple_tag(
         self, element: Dict[str, Any], attachments: List[Dict[str, Any]], tag: str
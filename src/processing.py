@@ -6,11 +6,12 @@ import html as html_lib
 import os
 import re
 import threading
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from bs4 import BeautifulSoup, Tag
 
-from .api import RanobeLibAPI
+from .api import PARALLEL_REQUESTS, RanobeLibAPI
 from .branches import parse_chapter_number
 from .cache import ChapterCache
 from .img import ImageHandler
@@ -240,9 +241,23 @@ class HtmlProcessor:
 class ChapterFormatter:
     """Форматирование текстовых блоков и заголовков."""
 
-    def format_chapter_title(self, chapter_name: str, chapter_number: str, volume_number: str, total_volumes: int) -> str:
+    def should_prepend_volume(self, total_volumes: int) -> bool:
+        """Нужно ли добавлять номер тома в заголовок главы (тома не группируются)."""
+        return total_volumes > 1 and not settings.get("group_by_volumes")
+
+    def format_chapter_title(
+        self,
+        chapter_name: str,
+        chapter_number: str,
+        volume_number: str,
+        total_volumes: int,
+        prepend_volume: Optional[bool] = None,
+    ) -> str:
         """Форматирует заголовок главы с учетом настроек (group_by_volumes)."""
-        if total_volumes > 1 and not settings.get("group_by_volumes") and volume_number != "0":
+        if prepend_volume is None:
+            prepend_volume = self.should_prepend_volume(total_volumes)
+
+        if prepend_volume and volume_number != "0":
             title = f"Том {volume_number} Глава {chapter_number}"
         else:
             title = f"Глава {chapter_number}"
@@ -319,11 +334,16 @@ class ChapterLoader:
 
         from tqdm import tqdm
 
-        prepared: List[Dict[str, Any]] = []
-        for i, ch_data in enumerate(tqdm(filtered, desc="⏱️ Загрузка глав", unit="ch", miniters=1, smoothing=0.1)):
-            prepared.append(
-                self._process_single_chapter(ch_data, novel_info, image_folder)
+        prepared: List[Dict[str, Any]] = list(
+            tqdm(
+                self.iter_processed_chapters(filtered, novel_info, image_folder),
+                total=len(filtered),
+                desc="⏱️ Загрузка глав",
+                unit="ch",
+                miniters=1,
+                smoothing=0.1,
             )
+        )
 
         with self._cache_lock:
             self._global_cache[cache_key] = prepared
@@ -363,25 +383,77 @@ class ChapterLoader:
                 for branch in chapter.get("branches", [])
             ]
 
-        filtered.sort(key=lambda x: x["chapter"].get("index", 0))
-        filtered.sort(key=lambda x: parse_chapter_number(x["chapter"].get("number", "0")))
+        filtered.sort(
+            key=lambda x: (parse_chapter_number(x["chapter"].get("number", "0")), x["chapter"].get("index", 0))
+        )
         return filtered
 
-    def _fetch_chapter_html(
+    def iter_processed_chapters(
+        self,
+        chapters: List[Dict[str, Any]],
+        novel_info: Dict[str, Any],
+        image_folder: str,
+        max_workers: int = PARALLEL_REQUESTS,
+    ) -> Iterator[Dict[str, Any]]:
+        """Последовательная обработка глав с параллельной предзагрузкой их содержимого из API."""
+        if max_workers <= 1 or len(chapters) <= 1:
+            for ch_data in chapters:
+                yield self._process_single_chapter(ch_data, novel_info, image_folder)
+            return
+
+        novel_id = str(novel_info.get("id"))
+        cached_keys = self.cache.get_cached_chapters(novel_id) if self.cache_chapters else set()
+        window = max_workers * 2
+        pending: Dict[int, Future] = {}
+        next_index = 0
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            for i, ch_data in enumerate(chapters):
+                while next_index < len(chapters) and next_index < i + window:
+                    volume, number, branch_id = self._chapter_key(chapters[next_index])
+                    if (branch_id, volume, number) not in cached_keys:
+                        pending[next_index] = executor.submit(
+                            self._fetch_chapter_data, novel_info, volume, number, branch_id
+                        )
+                    next_index += 1
+
+                yield self._process_single_chapter(ch_data, novel_info, image_folder, pending.pop(i, None))
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _chapter_key(ch_data: Dict[str, Any]) -> Tuple[str, str, str]:
+        """Возвращает (том, номер, id ветки) главы в строковом виде."""
+        ch_info = ch_data["chapter"]
+        branch = ch_data["branch"]
+
+        branch_id = "0"
+        if isinstance(branch, dict):
+            branch_id_val = branch.get("branch_id")
+            branch_id = str(branch_id_val if branch_id_val is not None else "0")
+        elif branch is not None:
+            branch_id = str(branch)
+
+        return str(ch_info.get("volume", "0")), str(ch_info.get("number", "0")), branch_id
+
+    def _fetch_chapter_data(
         self,
         novel_info: Dict[str, Any],
         volume: str,
         number: str,
         branch_id: str,
-    ) -> str:
-        """Получение HTML-контента главы (без обработки изображений)."""
-        chapter_data = self.api.get_chapter_content(
+    ) -> Dict[str, Any]:
+        """Запрос данных главы из API."""
+        return self.api.get_chapter_content(
             novel_info.get("slug_url") or f"{novel_info.get('id')}--{novel_info.get('slug')}",
             volume,
             number,
             branch_id if branch_id != "0" else None,
         )
 
+    def _chapter_data_to_html(self, chapter_data: Dict[str, Any]) -> str:
+        """Получение HTML-контента главы из ответа API (без обработки изображений)."""
         html = ""
         if chapter_data.get("content"):
             content = chapter_data["content"]
@@ -408,19 +480,12 @@ class ChapterLoader:
         ch_data: Dict[str, Any],
         novel_info: Dict[str, Any],
         image_folder: str,
+        prefetched: Optional["Future[Dict[str, Any]]"] = None,
     ) -> Dict[str, Any]:
         """Загрузка и обработка одной главы."""
         ch_info = ch_data["chapter"]
         branch = ch_data["branch"]
-
-        volume = str(ch_info.get("volume", "0"))
-        number = str(ch_info.get("number", "0"))
-        branch_id = "0"
-        if isinstance(branch, dict):
-            branch_id_val = branch.get("branch_id")
-            branch_id = str(branch_id_val if branch_id_val is not None else "0")
-        elif branch is not None:
-            branch_id = str(branch)
+        volume, number, branch_id = self._chapter_key(ch_data)
 
         novel_id = str(novel_info.get("id"))
         
@@ -459,7 +524,11 @@ class ChapterLoader:
                         del self.image_handler.image_counters[prefix]
 
         if processed_html is None:
-            raw_html = self._fetch_chapter_html(novel_info, volume, number, branch_id)
+            if prefetched is not None:
+                chapter_data = prefetched.result()
+            else:
+                chapter_data = self._fetch_chapter_data(novel_info, volume, number, branch_id)
+            raw_html = self._chapter_data_to_html(chapter_data)
             processed_html = self._prepare_chapter_content(raw_html, image_folder, branch_id)
             if self.cache_chapters:
                 self.cache.save_chapter(
@@ -533,6 +602,22 @@ class ContentProcessor:
         self.html_processor.update_settings()
         self.chapter_loader.update_settings()
         
+    def annotate_chapter_titles(self, prepared_chapters: List[Dict[str, Any]], total_volumes: int) -> None:
+        """Однократный расчет display_title и anchor_id подготовленных глав для текущих настроек."""
+        prepend_volume = self.chapter_formatter.should_prepend_volume(total_volumes)
+        decode = self.parser.decode_html_entities
+        format_title = self.chapter_formatter.format_chapter_title
+
+        for prep in prepared_chapters:
+            if prep.get("display_title_prepend") is prepend_volume:
+                continue
+            ch_name_decoded = decode(prep.get("name", "").strip())
+            prep["display_title"] = format_title(
+                ch_name_decoded, prep["number"], str(prep["volume"]), total_volumes, prepend_volume
+            )
+            prep["anchor_id"] = f'ch-{prep["volume"]}-{prep["number"]}'
+            prep["display_title_prepend"] = prepend_volume
+
     @classmethod
     def clear_novel_cache(cls, novel_id: Any) -> None:
         """Полная очистка кэшей для указанной новеллы."""